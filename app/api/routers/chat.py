@@ -5,6 +5,7 @@ from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
+import asyncio
 import json
 import time
 
@@ -42,6 +43,13 @@ class ChatResponse(BaseModel):
     media_references: Optional[Dict[str, Any]] = None
 
 
+async def _embed_query(text: str) -> List[List[float]]:
+    """질문 임베딩 생성 - encode 동안 이벤트 루프가 막히지 않도록 워커 스레드에서 실행"""
+    if settings.ENABLE_ASYNC_EMBEDDING:
+        return await asyncio.to_thread(get_embeddings, [text])
+    return get_embeddings([text])
+
+
 @router.post("/chat/stream/")
 async def chat_with_documents_stream(request: ChatRequest):
     """
@@ -84,7 +92,7 @@ async def chat_with_documents_stream(request: ChatRequest):
             
             try:
                 enhanced_query = QueryValidator.enhance_query_for_search(query)
-                query_embeddings = get_embeddings([enhanced_query])
+                query_embeddings = await _embed_query(enhanced_query)
                 if not query_embeddings:
                     fallback_data = FallbackResponseService.generate_error_response(
                         "embedding_error", "임베딩 생성 실패", query
@@ -296,7 +304,7 @@ async def chat_with_llm(chat_request: ChatRequest):
     try:
         logger.info("Step 1: Embedding user query...")
         enhanced_query = QueryValidator.enhance_query_for_search(query)
-        query_embedding_list = get_embeddings([enhanced_query])
+        query_embedding_list = await _embed_query(enhanced_query)
         if not query_embedding_list or not query_embedding_list[0]:
             raise EmbeddingError("Could not generate embedding for the query", "QUERY_EMBEDDING_FAILED")
         query_embedding = query_embedding_list[0]
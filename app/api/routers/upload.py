@@ -202,7 +202,7 @@ def process_pdf_background(
                 
                 update_status("Embedding", f"{len(text_chunks)}개 청크 임베딩 생성 중...", 65, total_pages, total_pages, 
                             {"chunks_count": len(text_chunks)})
-                text_embeddings = get_embeddings(text_chunks)
+                text_embeddings = get_embeddings(text_chunks, as_numpy=True)
                 
                 update_status("Metadata", "메타데이터 준비 중...", 75, total_pages, total_pages, {})
                 text_metadatas = [
@@ -359,6 +359,7 @@ async def upload_pdf(
                 logger.warning(f"File validation failed: {validation_result['errors']}")
                 results.append({"filename": file.filename, "error": f"File validation failed: {'; '.join(validation_result['errors'])}"})
                 continue
+            DocumentFileManager.register_file(document_id, file_path)
             active_tasks = len([status for status in pdf_processing_status.values() 
                               if status.get("step") not in ["Done", "Completed", "Error", "Queued"]])
             
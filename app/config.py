@@ -20,11 +20,22 @@ class Settings:
         int(os.getenv("MAX_FILE_SIZE", "100")) * 1024 * 1024
     )  # 100MB default
     ALLOWED_EXTENSIONS: list = os.getenv("ALLOWED_EXTENSIONS", ".pdf").split(",")
+    # File identity hash: "blake3" (if installed, falls back to sha256) or "sha256"
+    FILE_HASH_ALGORITHM: str = os.getenv("FILE_HASH_ALGORITHM", "blake3")
 
     # Vector DB settings
     CHROMA_DATA_PATH: str = os.getenv("CHROMA_DATA_PATH", "vector_db_data")
     COLLECTION_NAME: str = os.getenv("COLLECTION_NAME", "pdf_documents_collection")
 
+    # FAISS ANN index (optional, used in front of ChromaDB for text search)
+    FAISS_INDEX_ENABLED: bool = (
+        os.getenv("FAISS_INDEX_ENABLED", "True").lower() == "true"
+    )
+    FAISS_INDEX_FACTORY: str = os.getenv("FAISS_INDEX_FACTORY", "IVF256,PQ32")
+    FAISS_NPROBE: int = int(os.getenv("FAISS_NPROBE", "16"))
+    # IVF 학습에 필요한 최소 벡터 수 (클러스터당 약 39개)
+    FAISS_MIN_TRAIN_SIZE: int = int(os.getenv("FAISS_MIN_TRAIN_SIZE", "10000"))
+
     # Text processing settings
     CHUNK_SIZE: int = int(os.getenv("CHUNK_SIZE", "1000"))
     CHUNK_OVERLAP: int = int(os.getenv("CHUNK_OVERLAP", "150"))
@@ -102,10 +113,16 @@ class Settings:
     OCR_MAX_WORKERS: int = int(os.getenv("OCR_MAX_WORKERS", "8"))
     OCR_BATCH_SIZE: int = int(os.getenv("OCR_BATCH_SIZE", "4"))
     EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+    PRELOAD_EMBEDDING_MODEL: bool = (
+        os.getenv("PRELOAD_EMBEDDING_MODEL", "False").lower() == "true"
+    )
     ENABLE_PARALLEL_SEARCH: bool = (
         os.getenv("ENABLE_PARALLEL_SEARCH", "True").lower() == "true"
     )
     ENABLE_ASYNC_LLM: bool = os.getenv("ENABLE_ASYNC_LLM", "True").lower() == "true"
+    ENABLE_ASYNC_EMBEDDING: bool = (
+        os.getenv("ENABLE_ASYNC_EMBEDDING", "True").lower() == "true"
+    )
     CONTEXT_COMPRESSION_MAX_TOKENS: int = int(
         os.getenv("CONTEXT_COMPRESSION_MAX_TOKENS", "2000")
     )
@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
@@ -18,7 +19,16 @@ logger = get_logger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan — startup & shutdown events"""
-    logger.info("Application startup complete - embedding model will load on first request")
+    if settings.PRELOAD_EMBEDDING_MODEL:
+        from app.services.text_processing_service import model_manager
+        logger.info("Preloading embedding model at startup")
+        try:
+            await asyncio.to_thread(model_manager.get_model)
+            logger.info("Application startup complete - embedding model preloaded")
+        except Exception as e:
+            logger.error(f"Embedding model preload failed, will retry on first request: {e}")
+    else:
+        logger.info("Application startup complete - embedding model will load on first request")
     yield
     logger.info("Application shutting down")
 
@@ -0,0 +1,193 @@
+"""
+FAISS IVF-PQ 근사 최근접 이웃(ANN) 인덱스 - 텍스트 컬렉션 전단 검색 계층
+
+ChromaDB는 메타데이터/원문 저장소로 유지하고, 대규모 컬렉션에서의 벡터 유사도
+검색만 FAISS로 처리합니다. FAISS가 설치되어 있지 않거나 인덱스가 아직 학습되지
+않은 경우에는 기존 ChromaDB 검색 경로가 그대로 사용됩니다.
+"""
+import json
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Try to import faiss, fall back if not available
+try:
+    import faiss
+    import numpy as np
+    HAS_FAISS = True
+    logger.info("faiss library available for ANN text search")
+except ImportError:
+    HAS_FAISS = False
+    logger.info("faiss not available. ChromaDB similarity search will be used.")
+
+
+class FaissTextIndex:
+    """텍스트 청크 벡터용 FAISS IVF-PQ 인덱스 (ChromaDB ID와 매핑 유지)"""
+
+    def __init__(self, data_dir: str = None):
+        data_dir = data_dir or settings.CHROMA_DATA_PATH
+        self.index_path = os.path.join(data_dir, "faiss_text.index")
+        self.id_map_path = os.path.join(data_dir, "faiss_text_ids.json")
+        self._lock = threading.Lock()
+        self._index = None
+        self._id_to_chroma: Dict[int, str] = {}
+        self._chroma_to_id: Dict[str, int] = {}
+        self._next_id = 0
+        self.enabled = HAS_FAISS and settings.FAISS_INDEX_ENABLED
+        if self.enabled:
+            self._load()
+
+    @property
+    def is_ready(self) -> bool:
+        """학습이 끝나 검색에 사용할 수 있는 상태인지 여부"""
+        return self.enabled and self._index is not None and self._index.is_trained
+
+    def _load(self):
+        """디스크에 저장된 인덱스와 ID 매핑 로드"""
+        try:
+            if os.path.exists(self.index_path) and os.path.exists(self.id_map_path):
+                self._index = faiss.read_index(self.index_path)
+                with open(self.id_map_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self._id_to_chroma = {int(k): v for k, v in data.get('ids', {}).items()}
+                self._chroma_to_id = {v: k for k, v in self._id_to_chroma.items()}
+                self._next_id = data.get('next_id', len(self._id_to_chroma))
+                self._index.nprobe = settings.FAISS_NPROBE
+                logger.info(f"Loaded FAISS text index with {self._index.ntotal} vectors")
+        except Exception as e:
+            logger.error(f"Failed to load FAISS index, falling back to ChromaDB search: {e}")
+            self._reset_state()
+
+    def _save(self):
+        """인덱스와 ID 매핑을 ChromaDB 데이터 디렉토리에 저장"""
+        try:
+            faiss.write_index(self._index, self.index_path)
+            tmp_path = self.id_map_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'ids': self._id_to_chroma, 'next_id': self._next_id}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.id_map_path)
+        except Exception as e:
+            logger.error(f"Failed to persist FAISS index: {e}")
+
+    def _reset_state(self):
+        self._index = None
+        self._id_to_chroma = {}
+        self._chroma_to_id = {}
+        self._next_id = 0
+
+    def _add_locked(self, chroma_ids: List[str], vectors) -> None:
+        faiss_ids = []
+        for chroma_id in chroma_ids:
+            faiss_ids.append(self._next_id)
+            self._id_to_chroma[self._next_id] = chroma_id
+            self._chroma_to_id[chroma_id] = self._next_id
+            self._next_id += 1
+        self._index.add_with_ids(vectors, np.asarray(faiss_ids, dtype=np.int64))
+
+    def _train_locked(self, load_all: Callable[[], Tuple[List[str], List[List[float]]]], total_count: int) -> bool:
+        """저장된 전체 벡터로 인덱스를 학습하고 적재"""
+        if total_count < settings.FAISS_MIN_TRAIN_SIZE:
+            return False
+
+        all_ids, all_vectors = load_all()
+
+        vectors = np.asarray(all_vectors, dtype=np.float32)
+        index = faiss.index_factory(vectors.shape[1], settings.FAISS_INDEX_FACTORY, faiss.METRIC_L2)
+        logger.info(f"Training FAISS index '{settings.FAISS_INDEX_FACTORY}' on {len(all_ids)} vectors")
+        index.train(vectors)
+        index.nprobe = settings.FAISS_NPROBE
+
+        self._reset_state()
+        self._index = index
+        self._add_locked(all_ids, vectors)
+        logger.info(f"FAISS text index trained with {index.ntotal} vectors")
+        return True
+
+    def add(self, chroma_ids: List[str], vectors: List[List[float]],
+            load_all: Callable[[], Tuple[List[str], List[List[float]]]], total_count: int) -> None:
+        """
+        새 벡터를 인덱스에 추가. 아직 학습 전이면 충분한 벡터가 쌓였을 때 학습을 수행.
+
+        Args:
+            chroma_ids: ChromaDB에 저장된 청크 ID 목록
+            vectors: 청크 임베딩
+            load_all: 학습용으로 (ids, embeddings) 전체를 반환하는 함수
+            total_count: 컬렉션에 저장된 전체 벡터 수 (학습 가능 여부 판단용)
+        """
+        if not self.enabled or not chroma_ids:
+            return
+
+        try:
+            with self._lock:
+                if self._index is None or not self._index.is_trained:
+                    # 학습 시 방금 저장된 벡터까지 함께 적재됨
+                    if self._train_locked(load_all, total_count):
+                        self._save()
+                    return
+
+                self._add_locked(chroma_ids, np.asarray(vectors, dtype=np.float32))
+                self._save()
+        except Exception as e:
+            logger.error(f"Failed to add vectors to FAISS index: {e}")
+
+    def remove(self, chroma_ids: List[str]) -> None:
+        """ChromaDB에서 삭제된 청크를 인덱스에서도 제거"""
+        if not self.is_ready or not chroma_ids:
+            return
+
+        try:
+            with self._lock:
+                faiss_ids = [self._chroma_to_id.pop(cid) for cid in chroma_ids if cid in self._chroma_to_id]
+                for faiss_id in faiss_ids:
+                    self._id_to_chroma.pop(faiss_id, None)
+                if faiss_ids:
+                    self._index.remove_ids(np.asarray(faiss_ids, dtype=np.int64))
+                    self._save()
+        except Exception as e:
+            logger.error(f"Failed to remove vectors from FAISS index: {e}")
+
+    def clear(self) -> None:
+        """인덱스 전체 삭제 (다음 저장 시 재학습)"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._reset_state()
+            for path in (self.index_path, self.id_map_path):
+                try:
+                    if os.path.exists(path):
+                        os.remove(path)
+                except OSError as e:
+                    logger.error(f"Failed to remove FAISS index file {path}: {e}")
+
+    def search(self, query_vector: List[float], k: int) -> Optional[List[Tuple[str, float]]]:
+        """
+        근사 최근접 이웃 검색
+
+        Returns:
+            (ChromaDB ID, L2 거리) 목록. 인덱스를 사용할 수 없으면 None
+        """
+        if not self.is_ready:
+            return None
+
+        try:
+            query = np.asarray(query_vector, dtype=np.float32)[None, :]
+            with self._lock:
+                distances, faiss_ids = self._index.search(query, k)
+                return [
+                    (self._id_to_chroma[int(fid)], float(dist))
+                    for fid, dist in zip(faiss_ids[0], distances[0])
+                    if fid != -1 and int(fid) in self._id_to_chroma
+                ]
+        except Exception as e:
+            logger.error(f"FAISS search failed, falling back to ChromaDB: {e}")
+            return None
+
+
+# 전역 인덱스 인스턴스
+faiss_text_index = FaissTextIndex()
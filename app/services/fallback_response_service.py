@@ -8,6 +8,48 @@ from app.utils.query_validator import QueryValidator
 
 logger = get_logger(__name__)
 
+# 오류 응답 템플릿 (generate_error_response에서 매 호출 문자열을 새로 조립하지 않도록 상수로 유지)
+_ERROR_HEADER_TEMPLATE = """죄송합니다. 질문 "**{query}**" 처리 중 문제가 발생했습니다.
+
+**오류 상황:** {error_type}"""
+
+# 오류 유형 키워드별 원인/해결 방법 (키워드 검사 순서 유지)
+_ERROR_DETAILS = {
+    "embedding": """
+
+**가능한 원인:**
+- 네트워크 연결 문제
+- 임베딩 모델 로딩 실패
+
+**해결 방법:**
+- 잠시 후 다시 시도해주세요
+- 질문을 더 간단하게 바꿔보세요""",
+    "llm": """
+
+**가능한 원인:**
+- AI 모델 서버 연결 문제
+- 모델 응답 생성 실패
+
+**해결 방법:**
+- 잠시 후 다시 시도해주세요
+- 더 간단한 질문으로 시도해보세요""",
+    "vector": """
+
+**가능한 원인:**
+- 데이터베이스 연결 문제
+- 검색 인덱스 오류
+
+**해결 방법:**
+- 페이지를 새로고침해주세요
+- 다른 질문으로 시도해보세요""",
+}
+
+_DEFAULT_ERROR_DETAIL = """
+
+**해결 방법:**
+- 페이지를 새로고침하고 다시 시도해주세요
+- 문제가 지속되면 관리자에게 문의하세요"""
+
 class FallbackResponseService:
     """검색 결과가 없을 때의 대체 응답 서비스"""
     
@@ -165,49 +207,15 @@ class FallbackResponseService:
         Returns:
             str: 사용자 친화적 오류 응답
         """
-        base_message = f"""죄송합니다. 질문 "**{query}**" 처리 중 문제가 발생했습니다.
-
-**오류 상황:** {error_type}"""
-        
-        if "embedding" in error_type.lower():
-            base_message += """
-
-**가능한 원인:**
-- 네트워크 연결 문제
-- 임베딩 모델 로딩 실패
-
-**해결 방법:**
-- 잠시 후 다시 시도해주세요
-- 질문을 더 간단하게 바꿔보세요"""
-        
-        elif "llm" in error_type.lower():
-            base_message += """
-
-**가능한 원인:**
-- AI 모델 서버 연결 문제
-- 모델 응답 생성 실패
-
-**해결 방법:**
-- 잠시 후 다시 시도해주세요
-- 더 간단한 질문으로 시도해보세요"""
-        
-        elif "vector" in error_type.lower():
-            base_message += """
-
-**가능한 원인:**
-- 데이터베이스 연결 문제
-- 검색 인덱스 오류
-
-**해결 방법:**
-- 페이지를 새로고침해주세요
-- 다른 질문으로 시도해보세요"""
-        
-        else:
-            base_message += """
-
-**해결 방법:**
-- 페이지를 새로고침하고 다시 시도해주세요
-- 문제가 지속되면 관리자에게 문의하세요"""
+        lowered = error_type.lower()
+        # 일반적인 "<종류>_error" 형식은 dict 조회 한 번으로 처리, 그 외에는 포함 여부로 판별
+        detail = _ERROR_DETAILS.get(lowered.removesuffix("_error"))
+        if detail is None:
+            detail = next(
+                (text for keyword, text in _ERROR_DETAILS.items() if keyword in lowered),
+                _DEFAULT_ERROR_DETAIL
+            )
+        base_message = _ERROR_HEADER_TEMPLATE.format_map({"query": query, "error_type": error_type}) + detail
         
         # 기본 제안 질문 추가
         suggestions = QueryValidator.get_query_suggestions(query)
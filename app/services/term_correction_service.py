@@ -1,6 +1,7 @@
 """
 주조 용어 교정 및 표준화 서비스
 """
+import functools
 import json
 import re
 from typing import Dict, List, Tuple, Optional
@@ -9,6 +10,12 @@ from app.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# OCR 페이지에서 반복되는 짧은 텍스트(머리글, 표 셀 등)만 캐시
+TERM_CACHE_SIZE = 256
+TERM_CACHE_MAX_TEXT_LENGTH = 4096
+# 교정 결과가 다른 오류 패턴을 새로 만드는 경우(주혈사 -> 주형사 -> 주형) 재적용 상한
+LITERAL_CORRECTION_MAX_PASSES = 5
+
 class TermCorrectionService:
     """
     주조 기술 용어의 표준화와 교정을 담당하는 서비스
@@ -18,6 +25,7 @@ class TermCorrectionService:
         self.terminology_dict = self._load_terminology_dict()
         self.standard_terms = self._build_standard_terms_map()
         self.common_errors = self._build_common_error_patterns()
+        self._compile_patterns()
         
     def _load_terminology_dict(self) -> Dict:
         """주조 용어집 로드"""
@@ -107,6 +115,46 @@ class TermCorrectionService:
             (r'수척', '수축'),
         ]
     
+    @staticmethod
+    def _build_alternation(terms, boundary: bool = False, flags: int = 0) -> Optional[re.Pattern]:
+        """용어 목록을 하나의 alternation 정규식으로 컴파일 (긴 용어 우선 매칭)"""
+        if not terms:
+            return None
+        body = "|".join(map(re.escape, sorted(terms, key=len, reverse=True)))
+        if boundary:
+            body = r'\b(?:' + body + r')\b'
+        return re.compile(body, flags)
+
+    def _compile_patterns(self):
+        """교정 패턴을 한 번만 컴파일해 correct_text 호출마다 재사용"""
+        # 문맥(lookaround)이 필요한 패턴은 원래 순서대로 개별 적용
+        self._context_errors = []
+        literal_errors = {}
+        for pattern, replacement in self.common_errors:
+            if re.escape(pattern) == pattern:
+                literal_errors[pattern] = replacement
+            else:
+                self._context_errors.append((re.compile(pattern), replacement))
+
+        # 리터럴 오류(내장 목록 + foundry_terminology.json)는 단일 패스로 치환
+        ocr_errors = self.terminology_dict.get("common_ocr_errors", {})
+        for correct_term, error_patterns in ocr_errors.items():
+            for error_pattern in error_patterns:
+                if error_pattern != correct_term:
+                    literal_errors.setdefault(error_pattern, correct_term)
+        self._literal_errors = literal_errors
+        self._literal_errors_re = self._build_alternation(literal_errors)
+
+        # 표준 용어 변환: 자기 자신으로의 교체는 제외, 대소문자 무시 (casefold 키)
+        self._standard_lookup = {
+            term.casefold(): standard
+            for term, standard in self.standard_terms.items()
+            if term != standard
+        }
+        self._standard_terms_re = self._build_alternation(
+            self._standard_lookup, boundary=True, flags=re.IGNORECASE
+        )
+
     def correct_text(self, text: str) -> str:
         """
         주조 기술 텍스트의 용어를 교정하고 표준화
@@ -122,15 +170,21 @@ class TermCorrectionService:
             
         corrected_text = text
         
-        # 1. 일반적인 OCR 오류 패턴 교정
-        for pattern, replacement in self.common_errors:
-            corrected_text = re.sub(pattern, replacement, corrected_text)
+        # 1. 일반적인 OCR 오류 패턴 교정 (숫자/문자 혼동 등 문맥 의존 패턴)
+        for pattern, replacement in self._context_errors:
+            corrected_text = pattern.sub(replacement, corrected_text)
         
-        # 2. 알려진 OCR 오류 패턴 교정 (foundry_terminology.json에서)
-        ocr_errors = self.terminology_dict.get("common_ocr_errors", {})
-        for correct_term, error_patterns in ocr_errors.items():
-            for error_pattern in error_patterns:
-                corrected_text = corrected_text.replace(error_pattern, correct_term)
+        # 2. 알려진 OCR/타이핑 오류 교정 (내장 목록 + foundry_terminology.json)
+        # 치환 결과가 다시 오류 패턴이 될 수 있으므로 변화가 없을 때까지 재적용
+        if self._literal_errors_re is not None:
+            literal_errors = self._literal_errors
+            for _ in range(LITERAL_CORRECTION_MAX_PASSES):
+                previous = corrected_text
+                corrected_text = self._literal_errors_re.sub(
+                    lambda m: literal_errors[m.group(0)], corrected_text
+                )
+                if corrected_text == previous:
+                    break
         
         # 3. 표준 용어로 변환
         corrected_text = self._standardize_terms(corrected_text)
@@ -139,14 +193,12 @@ class TermCorrectionService:
     
     def _standardize_terms(self, text: str) -> str:
         """주조 용어를 표준 용어로 변환"""
-        # 단어 경계를 고려한 용어 교체
-        for term, standard in self.standard_terms.items():
-            if term != standard:  # 자기 자신으로의 교체 방지
-                # 완전한 단어 매치를 위한 패턴
-                pattern = r'\b' + re.escape(term) + r'\b'
-                text = re.sub(pattern, standard, text, flags=re.IGNORECASE)
-        
-        return text
+        # 단어 경계를 고려한 용어 교체 (단일 패스, 긴 용어 우선)
+        # IGNORECASE 매치(예: 'ſand mold')는 lower()가 아닌 casefold()로 키를 찾음
+        if self._standard_terms_re is None:
+            return text
+        lookup = self._standard_lookup
+        return self._standard_terms_re.sub(lambda m: lookup.get(m.group(0).casefold(), m.group(0)), text)
     
     def get_term_suggestions(self, query: str) -> List[str]:
         """
@@ -203,8 +255,14 @@ class TermCorrectionService:
 # 전역 인스턴스
 term_correction_service = TermCorrectionService()
 
+@functools.lru_cache(maxsize=TERM_CACHE_SIZE)
+def _correct_foundry_terms_cached(text: str) -> str:
+    return term_correction_service.correct_text(text)
+
 def correct_foundry_terms(text: str) -> str:
-    """주조 용어 교정 함수 (편의성을 위한 래퍼)"""
+    """주조 용어 교정 함수 (편의성을 위한 래퍼, 짧은 텍스트는 캐시)"""
+    if text and len(text) < TERM_CACHE_MAX_TEXT_LENGTH:
+        return _correct_foundry_terms_cached(text)
     return term_correction_service.correct_text(text)
 
 def validate_foundry_terms(text: str) -> Dict[str, List[str]]:
@@ -1,6 +1,7 @@
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from sentence_transformers import SentenceTransformer
 import numpy as np
+import functools
 import threading
 import re
 from typing import List, Dict, Any
@@ -33,7 +34,12 @@ class EmbeddingModelManager:
                 if self._model is None:
                     try:
                         logger.info(f"Loading embedding model: {settings.EMBEDDING_MODEL}")
-                        self._model = SentenceTransformer(settings.EMBEDDING_MODEL)
+                        model = SentenceTransformer(settings.EMBEDDING_MODEL)
+                        # 추론 전용: dropout 비활성화, GPU에서는 FP16 가중치 사용
+                        model.eval()
+                        if getattr(model.device, "type", None) == "cuda":
+                            model.half()
+                        self._model = model
                         logger.info("Embedding model loaded successfully")
                     except Exception as e:
                         logger.error(f"Error loading SentenceTransformer model '{settings.EMBEDDING_MODEL}': {e}")
@@ -44,6 +50,18 @@ class EmbeddingModelManager:
 model_manager = EmbeddingModelManager()
 
 
+@functools.lru_cache(maxsize=8)
+def _get_text_splitter(chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+    """Return a shared splitter per (chunk_size, chunk_overlap); separators are compiled once"""
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        length_function=len,
+        is_separator_regex=False,
+        separators=["\n\n", "\n", " ", ""]
+    )
+
+
 def split_text_into_chunks(text: str, chunk_size: int = None, chunk_overlap: int = None, apply_correction: bool = False) -> List[str]:
     """
     Splits a long text into smaller, overlapping chunks using Langchain's RecursiveCharacterTextSplitter.
@@ -61,13 +79,7 @@ def split_text_into_chunks(text: str, chunk_size: int = None, chunk_overlap: int
     chunk_overlap = chunk_overlap or settings.CHUNK_OVERLAP
 
     try:
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            length_function=len,
-            is_separator_regex=False,
-            separators=["\n\n", "\n", " ", ""]
-        )
+        text_splitter = _get_text_splitter(chunk_size, chunk_overlap)
         chunks = text_splitter.split_text(text)
         
         # Apply OCR correction if requested
@@ -124,13 +136,7 @@ def split_text_into_chunks_with_progress(
             progress_callback(total_pages, total_pages, "text_splitting", 
                             f"텍스트 분할 중... (예상 {estimated_chunks}개 청크)")
         
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            length_function=len,
-            is_separator_regex=False,
-            separators=["\n\n", "\n", " ", ""]
-        )
+        text_splitter = _get_text_splitter(chunk_size, chunk_overlap)
         
         # 실제 분할 실행
         chunks = text_splitter.split_text(text)
@@ -145,16 +151,18 @@ def split_text_into_chunks_with_progress(
         valid_chunks = []
         min_chunk_length = 10  # 최소 청크 길이
         
+        # 대량 청크일 때만 중간 진행률을 보고하므로 조건을 루프 밖에서 한 번 계산
+        report_progress = progress_callback is not None and actual_chunks > 100
+        
         for i, chunk in enumerate(chunks):
-            if len(chunk.strip()) >= min_chunk_length:
-                valid_chunks.append(chunk.strip())
+            stripped = chunk.strip()
+            if len(stripped) >= min_chunk_length:
+                valid_chunks.append(stripped)
             
             # 중간 진행률 업데이트 (대량 청크의 경우)
-            if len(chunks) > 100 and i % 50 == 0:
-                progress = 59 + (i / len(chunks)) * 1  # 59-60% 범위
-                if progress_callback:
-                    progress_callback(total_pages, total_pages, "chunk_validation", 
-                                    f"청크 검증 중... ({i+1}/{len(chunks)}) - {len(valid_chunks)}개 유효")
+            if report_progress and i % 50 == 0:
+                progress_callback(total_pages, total_pages, "chunk_validation", 
+                                f"청크 검증 중... ({i+1}/{actual_chunks}) - {len(valid_chunks)}개 유효")
         
         chunks = valid_chunks
         
@@ -209,13 +217,15 @@ def get_optimal_batch_size(num_chunks: int, available_memory_gb: float = 4.0) ->
     
     return optimal_batch_size
 
-def get_embeddings(text_chunks: List[str], batch_size: int = None) -> List[List[float]]:
+def get_embeddings(text_chunks: List[str], batch_size: int = None, as_numpy: bool = False):
     """
     Converts text chunks into vector embeddings with optimized batch processing.
     Returns a list of embeddings, where each embedding is a list of floats.
+    With as_numpy=True a contiguous float32 array of shape (N, D) is returned instead,
+    which ChromaDB and FAISS ingest without building per-float Python objects.
     """
     if not text_chunks:
-        return []
+        return np.empty((0, 0), dtype=np.float32) if as_numpy else []
     
     try:
         model = model_manager.get_model()
@@ -226,11 +236,14 @@ def get_embeddings(text_chunks: List[str], batch_size: int = None) -> List[List[
         
         logger.info(f"Generating embeddings for {len(text_chunks)} chunks using '{settings.EMBEDDING_MODEL}' (batch_size: {batch_size})")
         
-        # 빈 청크 제거 및 검증
+        # 빈 청크 제거 및 검증 (원래 위치는 valid_indices로 보존)
         non_empty_chunks = []
+        valid_indices = []
         for i, chunk in enumerate(text_chunks):
-            if chunk and chunk.strip() and len(chunk.strip()) >= 2:  # 최소 2자 이상
-                non_empty_chunks.append(chunk.strip())
+            stripped = chunk.strip() if chunk else ""
+            if len(stripped) >= 2:  # 최소 2자 이상
+                non_empty_chunks.append(stripped)
+                valid_indices.append(i)
             else:
                 logger.debug(f"Skipped empty/short chunk at index {i}")
         
@@ -239,66 +252,40 @@ def get_embeddings(text_chunks: List[str], batch_size: int = None) -> List[List[
         
         if not non_empty_chunks:
             logger.warning("No valid chunks found for embedding generation")
-            return []
-        
-        # Process in batches for better memory management
-        all_embeddings = []
-        total_batches = (len(non_empty_chunks) + batch_size - 1) // batch_size
-        
-        for i in range(0, len(non_empty_chunks), batch_size):
-            batch = non_empty_chunks[i:i + batch_size]
-            current_batch_num = i // batch_size + 1
-            
-            logger.debug(f"Processing batch {current_batch_num}/{total_batches} ({len(batch)} chunks)")
-            
-            try:
-                # Generate embeddings for this batch with optimized settings
-                batch_embeddings = model.encode(
-                    batch, 
-                    convert_to_tensor=False,
-                    show_progress_bar=False,
-                    batch_size=min(len(batch), 32),  # 메모리 제한을 위해 최대 32개씩
-                    normalize_embeddings=True  # 정규화로 성능 향상
-                )
-                
-                # Convert to list format
-                if len(batch_embeddings.shape) == 1:
-                    # 단일 임베딩인 경우
-                    batch_embeddings_list = [batch_embeddings.tolist()]
-                else:
-                    # 여러 임베딩인 경우
-                    batch_embeddings_list = [embedding.tolist() for embedding in batch_embeddings]
-                
-                all_embeddings.extend(batch_embeddings_list)
-                
-            except Exception as batch_error:
-                logger.error(f"Error processing batch {current_batch_num}: {batch_error}")
-                # 실패한 배치에 대해 더미 임베딩 생성
-                model_dim = getattr(model, 'get_sentence_embedding_dimension', lambda: 384)()
-                dummy_embeddings = [[0.0] * model_dim for _ in batch]
-                all_embeddings.extend(dummy_embeddings)
-                logger.warning(f"Used dummy embeddings for failed batch {current_batch_num}")
+            return np.empty((0, 0), dtype=np.float32) if as_numpy else []
+        
+        # Single encode call: sentence-transformers tiles the input into batch_size
+        # batches internally and normalizes in the same pass
+        try:
+            embeddings = model.encode(
+                non_empty_chunks,
+                batch_size=min(batch_size, 32),  # 메모리 사용량 제한
+                convert_to_tensor=False,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+                normalize_embeddings=True  # 정규화로 성능 향상
+            )
+            if embeddings.ndim == 1:
+                # 단일 임베딩인 경우
+                embeddings = embeddings[np.newaxis, :]
             
-            # 메모리 정리
-            import gc
-            gc.collect()
-        
-        # 빈 청크에 대한 더미 임베딩 추가 (원래 순서 유지)
+        except Exception as encode_error:
+            logger.error(f"Error encoding {len(non_empty_chunks)} chunks: {encode_error}")
+            # 실패 시 더미 임베딩 생성
+            model_dim = getattr(model, 'get_sentence_embedding_dimension', lambda: 384)()
+            embeddings = np.zeros((len(non_empty_chunks), model_dim), dtype=np.float32)
+            logger.warning("Used dummy embeddings for failed encode")
+        
+        # 빈 청크에 대한 제로 벡터 추가 (원래 순서 유지)
         if len(non_empty_chunks) != len(text_chunks):
-            final_embeddings = []
-            embedding_idx = 0
-            for chunk in text_chunks:
-                if chunk.strip():
-                    final_embeddings.append(all_embeddings[embedding_idx])
-                    embedding_idx += 1
-                else:
-                    # 빈 청크에 대한 제로 벡터
-                    model_dim = len(all_embeddings[0]) if all_embeddings else 384
-                    final_embeddings.append([0.0] * model_dim)
-            all_embeddings = final_embeddings
-        
-        logger.info(f"Successfully generated {len(all_embeddings)} embeddings")
-        return all_embeddings
+            final_embeddings = np.zeros((len(text_chunks), embeddings.shape[1]), dtype=embeddings.dtype)
+            final_embeddings[valid_indices] = embeddings
+            embeddings = final_embeddings
+        
+        logger.info(f"Successfully generated {len(embeddings)} embeddings")
+        if as_numpy:
+            return np.ascontiguousarray(embeddings, dtype=np.float32)
+        return embeddings.tolist()
         
     except Exception as e:
         logger.error(f"Error during embedding generation: {e}")
@@ -320,7 +307,7 @@ def process_text_only_pdf_and_store(pdf_path: str, document_id: str, filename: s
             return {"status": "skipped", "reason": "no text extracted"}
 
         text_chunks = split_text_into_chunks(extracted_text)
-        embeddings = get_embeddings(text_chunks)
+        embeddings = get_embeddings(text_chunks, as_numpy=True)
         
         # Prepare metadata for each chunk
         metadatas = [
@@ -381,7 +368,7 @@ def process_multimodal_pdf_and_store(pdf_path: str, document_id: str, filename:
             # 임베딩 생성 (65%)
             if progress_callback:
                 progress_callback(document_id, 65, "embedding", f"{len(text_chunks)}개 청크 임베딩 생성 중...")
-            text_embeddings = get_embeddings(text_chunks)
+            text_embeddings = get_embeddings(text_chunks, as_numpy=True)
             
             # 메타데이터 준비 (75%)
             if progress_callback:
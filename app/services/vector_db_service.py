@@ -3,10 +3,12 @@ import os
 import json
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
+import numpy as np
 from app.config import settings
 from app.utils.logging_config import get_logger
 from app.utils.exceptions import VectorDBError
+from app.services.ann_index_service import faiss_text_index
 
 logger = get_logger(__name__)
 
@@ -58,12 +60,12 @@ def store_multimodal_content(document_id: str, content_data: Dict[str, Any], tex
     Args:
         document_id (str): A unique identifier for the source document.
         content_data (Dict[str, Any]): Dictionary containing 'text_chunks', 'images', 'tables'.
-        text_vectors (List[List[float]], optional): Vector embeddings for text chunks.
+        text_vectors (List[List[float]] | np.ndarray, optional): Vector embeddings for text chunks.
         text_metadatas (List[Dict[str, Any]], optional): Metadata for text chunks.
     """
     try:
         # 1. Store text content
-        if text_collection and text_vectors:
+        if text_collection and text_vectors is not None and len(text_vectors) > 0:
             text_chunks = content_data.get('text_chunks', [])
             if text_chunks:
                 # Ensure all lists have the same length
@@ -73,7 +75,7 @@ def store_multimodal_content(document_id: str, content_data: Dict[str, Any], tex
                 valid_vectors = text_vectors[:min_len]
                 valid_metadatas = text_metadatas[:min_len] if text_metadatas else None
                 
-                if valid_chunks and valid_vectors:
+                if valid_chunks and len(valid_vectors) > 0:
                     store_text_vectors(document_id, valid_chunks, valid_vectors, valid_metadatas)
                     logger.info(f"Stored {len(valid_chunks)} text chunks for document: {document_id}")
 
@@ -97,7 +99,7 @@ def store_multimodal_content(document_id: str, content_data: Dict[str, Any], tex
         logger.error(f"Error storing multimodal content for {document_id}: {e}")
         raise VectorDBError(f"Failed to store multimodal content: {e}", "STORE_ERROR")
 
-def store_text_vectors(document_id: str, text_chunks: List[str], vectors: List[List[float]], metadatas: List[Dict[str, Any]] = None):
+def store_text_vectors(document_id: str, text_chunks: List[str], vectors: Union[List[List[float]], np.ndarray], metadatas: List[Dict[str, Any]] = None):
     """
     Stores text chunks and their vectors in the text collection.
     """
@@ -105,7 +107,7 @@ def store_text_vectors(document_id: str, text_chunks: List[str], vectors: List[L
         logger.error("Text collection is not available. Cannot store vectors.")
         raise VectorDBError("Text collection not available", "COLLECTION_UNAVAILABLE")
 
-    if not text_chunks or not vectors:
+    if not text_chunks or vectors is None or len(vectors) == 0:
         logger.error("Text chunks or vectors are empty. Nothing to store.")
         raise VectorDBError("Empty text chunks or vectors", "EMPTY_DATA")
 
@@ -149,6 +151,15 @@ def store_text_vectors(document_id: str, text_chunks: List[str], vectors: List[L
         logger.error(f"Error storing vectors in ChromaDB for document '{document_id}': {e}")
         raise VectorDBError(f"Failed to store vectors: {e}", "CHROMADB_STORE_ERROR")
 
+    # ANN 인덱스 동기화 (실패해도 ChromaDB 저장은 유지됨)
+    if faiss_text_index.enabled:
+        faiss_text_index.add(ids, vectors, _load_all_text_embeddings, text_collection.count())
+
+def _load_all_text_embeddings():
+    """FAISS 인덱스 학습용으로 텍스트 컬렉션의 전체 ID와 임베딩을 반환"""
+    results = text_collection.get(include=["embeddings"])
+    return results['ids'], results['embeddings']
+
 def store_images(document_id: str, images_data: List[Dict[str, Any]]):
     """
     Stores image metadata and descriptions in the images collection.
@@ -343,12 +354,15 @@ def search_text_vectors(query_vector: List[float], top_k: int = 5, filter_metada
         # Perform similarity search
         where_clause = filter_metadata if filter_metadata else None
         
-        results = text_collection.query(
-            query_embeddings=[query_vector],
-            n_results=top_k,
-            where=where_clause,
-            include=['documents', 'metadatas', 'distances']
-        )
+        # FAISS 인덱스가 준비되어 있으면 ANN 후보를 먼저 찾고 ChromaDB에서 원문/메타데이터 조회
+        results = _search_text_with_ann(query_vector, top_k, where_clause)
+        if results is None:
+            results = text_collection.query(
+                query_embeddings=[query_vector],
+                n_results=top_k,
+                where=where_clause,
+                include=['documents', 'metadatas', 'distances']
+            )
         
         # Format results with similarity threshold filtering
         formatted_results = []
@@ -384,6 +398,36 @@ def search_text_vectors(query_vector: List[float], top_k: int = 5, filter_metada
         logger.error(f"Error searching similar vectors: {e}")
         raise VectorDBError(f"Vector search failed: {e}", "SEARCH_ERROR")
 
+def _search_text_with_ann(query_vector: List[float], top_k: int, where_clause: Optional[Dict[str, Any]]) -> Optional[Dict[str, List[List[Any]]]]:
+    """
+    FAISS 후보 검색 후 ChromaDB에서 ID로 원문과 메타데이터를 가져와
+    text_collection.query와 같은 형식으로 반환. 인덱스를 사용할 수 없거나
+    필터 적용 후 후보가 부족하면 None을 반환해 ChromaDB 검색으로 대체.
+    """
+    candidates = faiss_text_index.search(query_vector, top_k * 4)
+    if not candidates:
+        return None
+
+    distance_by_id = dict(candidates)
+    fetched = text_collection.get(
+        ids=list(distance_by_id),
+        where=where_clause,
+        include=['documents', 'metadatas']
+    )
+    if not fetched or len(fetched.get('ids') or []) < top_k:
+        return None
+
+    ranked = sorted(
+        zip(fetched['ids'], fetched['documents'], fetched['metadatas']),
+        key=lambda item: distance_by_id[item[0]]
+    )[:top_k]
+    return {
+        'ids': [[item[0] for item in ranked]],
+        'documents': [[item[1] for item in ranked]],
+        'metadatas': [[item[2] for item in ranked]],
+        'distances': [[distance_by_id[item[0]] for item in ranked]]
+    }
+
 def search_images(filter_metadata: Dict[str, Any] = None, top_k: int = 5) -> List[Dict[str, Any]]:
     """
     Searches for relevant images based on metadata filters.
@@ -535,6 +579,7 @@ def delete_multimodal_document(document_id: str) -> bool:
             text_results = text_collection.get(where={"$and": [{"source_document_id": document_id}, {"content_type": "text"}]})
             if text_results['ids']:
                 text_collection.delete(ids=text_results['ids'])
+                faiss_text_index.remove(text_results['ids'])
                 logger.info(f"Deleted {len(text_results['ids'])} text chunks for document {document_id}")
                 deleted = True
         
@@ -575,6 +620,7 @@ def delete_all_multimodal_documents() -> int:
             text_results = text_collection.get(include=["metadatas"])
             if text_results['ids']:
                 text_collection.delete(ids=text_results['ids'])
+                faiss_text_index.clear()
                 # Extract unique document IDs
                 metadatas = text_results.get("metadatas", [])
                 if metadatas:
@@ -1,9 +1,11 @@
 import json
 import os
 import random
+import sys
 import asyncio
+from collections import deque
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from pathlib import Path
 
 from app.services.llm_service import get_llm_response
@@ -14,6 +16,48 @@ from app.utils.exceptions import LLMError
 
 logger = get_logger(__name__)
 
+# Try to import ijson for streaming parse, fall back to json.load if not available
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# 주제 라벨 (한 번만 intern하여 집합 연산 시 포인터 비교로 처리)
+TOPIC_FOUNDRY = sys.intern("주조기술")
+TOPIC_QUALITY = sys.intern("품질관리")
+TOPIC_PROCESS = sys.intern("공정기술")
+TOPIC_DESIGN = sys.intern("설계기술")
+TOPIC_MATERIAL = sys.intern("재료공학")
+TOPIC_HEAT_TREATMENT = sys.intern("열처리")
+
+
+def _interned(*words: str) -> tuple:
+    return tuple(sys.intern(word) for word in words)
+
+
+# 문서 내용 기반 주제 분류 규칙: (주제, 탐지 키워드, 추가할 내용 키워드)
+# 비트 i는 _TOPIC_RULES[i]에 대응
+_TOPIC_RULES = (
+    (TOPIC_FOUNDRY, _interned("주물", "주조", "casting", "foundry", "용해", "응고"), _interned("주조", "주물", "용해")),
+    (TOPIC_QUALITY, _interned("결함", "품질", "검사", "측정", "관리", "defect", "quality"), _interned("품질관리", "결함분석")),
+    (TOPIC_PROCESS, _interned("공정", "제조", "가공", "process", "manufacturing"), _interned("제조공정", "가공기술")),
+    (TOPIC_DESIGN, _interned("설계", "design", "모델링", "해석"), _interned("설계", "모델링")),
+    (TOPIC_MATERIAL, _interned("재료", "합금", "금속", "material", "alloy", "metal"), _interned("재료", "합금", "금속")),
+    (TOPIC_HEAT_TREATMENT, _interned("열처리", "어닐링", "템퍼링", "heat treatment"), _interned("열처리", "금속처리")),
+)
+_ALL_TOPICS_MASK = (1 << len(_TOPIC_RULES)) - 1
+
+
+def _classify_preview(preview_text: str) -> int:
+    """소문자 미리보기 텍스트가 해당하는 주제들의 비트마스크 반환"""
+    mask = 0
+    for bit, (_, keywords, _) in enumerate(_TOPIC_RULES):
+        if any(keyword in preview_text for keyword in keywords):
+            mask |= 1 << bit
+    return mask
+
+
 class WelcomeMessageService:
     """환영메시지 생성 및 관리 서비스"""
     
@@ -35,16 +79,40 @@ class WelcomeMessageService:
             logger.error(f"환영메시지 로드 실패: {e}")
             return []
     
-    def _save_messages(self, messages: List[Dict[str, Any]]) -> bool:
-        """환영메시지들을 저장"""
+    def _iter_messages(self) -> Iterator[Dict[str, Any]]:
+        """저장된 환영메시지를 하나씩 스트리밍으로 반환 (전체 파싱 트리를 만들지 않음)"""
+        try:
+            if not self.welcome_messages_file.exists():
+                return
+            if HAS_IJSON:
+                with open(self.welcome_messages_file, 'rb') as f:
+                    yield from ijson.items(f, 'messages.item')
+            else:
+                yield from self._load_messages()
+        except Exception as e:
+            logger.error(f"환영메시지 스트리밍 로드 실패: {e}")
+    
+    def _save_messages(self, messages: List[Dict[str, Any]], durable: bool = False) -> bool:
+        """환영메시지들을 저장 (임시 파일에 쓴 뒤 os.replace로 원자적 교체)
+
+        Args:
+            messages: 저장할 메시지 목록
+            durable: True이면 교체 전에 fsync로 디스크 기록을 보장 (종료 시 사용)
+        """
         try:
             data = {
                 'messages': messages,
                 'last_updated': datetime.now().isoformat(),
                 'version': '1.0'
             }
-            with open(self.welcome_messages_file, 'w', encoding='utf-8') as f:
+            tmp_file = self.welcome_messages_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            # 쓰기 도중 중단되어도 기존 파일은 손상되지 않음
+            os.replace(tmp_file, self.welcome_messages_file)
             logger.info(f"환영메시지 {len(messages)}개 저장 완료")
             return True
         except Exception as e:
@@ -72,51 +140,31 @@ class WelcomeMessageService:
             topics = set()
             content_keywords = set()
             
-            # 실제 문서 내용에서 키워드 추출
+            # 실제 문서 내용에서 키워드 추출 (문서별 비트마스크를 모아 마지막에 한 번만 변환)
+            topic_mask = 0
             for doc in documents:
                 preview_text = doc.get("first_chunk_preview", "").lower()
                 if preview_text:
-                    # 주조 관련 키워드
-                    if any(keyword in preview_text for keyword in ["주물", "주조", "casting", "foundry", "용해", "응고"]):
-                        topics.add("주조기술")
-                        content_keywords.update(["주조", "주물", "용해"])
-                    
-                    # 품질관리 키워드
-                    if any(keyword in preview_text for keyword in ["결함", "품질", "검사", "측정", "관리", "defect", "quality"]):
-                        topics.add("품질관리")
-                        content_keywords.update(["품질관리", "결함분석"])
-                    
-                    # 공정기술 키워드
-                    if any(keyword in preview_text for keyword in ["공정", "제조", "가공", "process", "manufacturing"]):
-                        topics.add("공정기술")
-                        content_keywords.update(["제조공정", "가공기술"])
-                    
-                    # 설계 키워드
-                    if any(keyword in preview_text for keyword in ["설계", "design", "모델링", "해석"]):
-                        topics.add("설계기술")
-                        content_keywords.update(["설계", "모델링"])
-                    
-                    # 재료 키워드
-                    if any(keyword in preview_text for keyword in ["재료", "합금", "금속", "material", "alloy", "metal"]):
-                        topics.add("재료공학")
-                        content_keywords.update(["재료", "합금", "금속"])
-                    
-                    # 열처리 키워드
-                    if any(keyword in preview_text for keyword in ["열처리", "어닐링", "템퍼링", "heat treatment"]):
-                        topics.add("열처리")
-                        content_keywords.update(["열처리", "금속처리"])
+                    topic_mask |= _classify_preview(preview_text)
+                    if topic_mask == _ALL_TOPICS_MASK:
+                        break
+            
+            for bit, (topic, _, keywords) in enumerate(_TOPIC_RULES):
+                if topic_mask >> bit & 1:
+                    topics.add(topic)
+                    content_keywords.update(keywords)
             
             # 파일명 기반 보조 분석 (내용이 부족할 때만)
             if not topics:
                 for name in document_names:
                     if "주물" in name or "foundry" in name.lower():
-                        topics.add("주조기술")
+                        topics.add(TOPIC_FOUNDRY)
                     if "결함" in name:
-                        topics.add("품질관리")
+                        topics.add(TOPIC_QUALITY)
                     if "설계" in name:
-                        topics.add("설계기술")
+                        topics.add(TOPIC_DESIGN)
                     if "공정" in name:
-                        topics.add("공정기술")
+                        topics.add(TOPIC_PROCESS)
             
             if not topics:
                 topics.add("기술문서")
@@ -363,12 +411,17 @@ def get_random_welcome_message() -> str:
 
 def get_welcome_message_stats() -> Dict[str, Any]:
     """환영메시지 통계 (편의 함수)"""
-    messages = welcome_service.get_all_messages()
+    # 최근 3개와 개수만 필요하므로 스트리밍하며 한 번에 집계
+    recent_messages = deque(maxlen=3)
+    total_messages = 0
+    for message in welcome_service._iter_messages():
+        recent_messages.append(message)
+        total_messages += 1
     doc_summary = welcome_service.get_document_summary()
     
     return {
-        'total_messages': len(messages),
-        'recent_messages': messages[-3:] if messages else [],
+        'total_messages': total_messages,
+        'recent_messages': list(recent_messages),
         'document_summary': doc_summary,
-        'last_generated': messages[-1].get('created_at') if messages else None
+        'last_generated': recent_messages[-1].get('created_at') if recent_messages else None
     }
\ No newline at end of file
@@ -4,13 +4,51 @@ import os
 import glob
 import shutil
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from app.config import settings
 from app.utils.logging_config import get_logger
 from app.utils.exceptions import FileProcessingError
 
 logger = get_logger(__name__)
 
+# (업로드 디렉토리, document_id) -> 파일명 목록 인덱스
+# 업로드 시 등록되고, 조회 실패 시 디렉토리를 한 번 스캔하여 채워짐
+_DOC_ID_INDEX: Dict[Tuple[str, str], List[str]] = {}
+
+
+def _find_document_files(upload_path: Path, document_id: str) -> List[Path]:
+    """document_id에 해당하는 업로드 파일 경로 목록 (인덱스 우선, 없으면 scandir 1회)"""
+    key = (str(upload_path), document_id)
+    names = _DOC_ID_INDEX.get(key)
+    if names:
+        paths = [upload_path / name for name in names]
+        if all(path.exists() for path in paths):
+            return paths
+        # 외부에서 파일이 변경된 경우 인덱스를 다시 채움
+    
+    if not upload_path.exists():
+        _DOC_ID_INDEX.pop(key, None)
+        return []
+    
+    prefix = f"{document_id}_"
+    with os.scandir(upload_path) as entries:
+        names = [entry.name for entry in entries
+                 if entry.name.startswith(prefix) and entry.name.endswith(".pdf")]
+    
+    if names:
+        _DOC_ID_INDEX[key] = names
+    else:
+        _DOC_ID_INDEX.pop(key, None)
+    return [upload_path / name for name in names]
+
+
+def _clear_document_index(upload_path: Path) -> None:
+    """해당 업로드 디렉토리의 인덱스 항목 전체 제거"""
+    upload_dir = str(upload_path)
+    for key in [key for key in _DOC_ID_INDEX if key[0] == upload_dir]:
+        del _DOC_ID_INDEX[key]
+
+
 class DocumentFileManager:
     """Manages uploaded document files and their lifecycle"""
     
@@ -60,6 +98,20 @@ class DocumentFileManager:
             logger.error(f"Error listing uploaded files: {e}")
             raise FileProcessingError(f"Failed to list files: {e}", "LIST_FILES_ERROR")
     
+    @staticmethod
+    def register_file(document_id: str, file_path) -> None:
+        """
+        업로드된 파일을 document_id 인덱스에 등록합니다.
+        
+        Args:
+            document_id (str): 문서 ID
+            file_path: 저장된 파일 경로
+        """
+        file_path = Path(file_path)
+        names = _DOC_ID_INDEX.setdefault((str(file_path.parent), document_id), [])
+        if file_path.name not in names:
+            names.append(file_path.name)
+    
     @staticmethod
     def delete_file_by_document_id(document_id: str) -> bool:
         """
@@ -74,8 +126,8 @@ class DocumentFileManager:
         try:
             upload_path = Path(settings.UPLOAD_DIR)
             # document_id로 시작하는 파일 찾기
-            pattern = f"{document_id}_*.pdf"
-            matching_files = list(upload_path.glob(pattern))
+            matching_files = _find_document_files(upload_path, document_id)
+            _DOC_ID_INDEX.pop((str(upload_path), document_id), None)
             
             if not matching_files:
                 logger.warning(f"No files found for document_id: {document_id}")
@@ -112,6 +164,7 @@ class DocumentFileManager:
             
             pdf_files = list(upload_path.glob("*.pdf"))
             deleted_count = 0
+            _clear_document_index(upload_path)
             
             for file_path in pdf_files:
                 try:
@@ -141,8 +194,7 @@ class DocumentFileManager:
         """
         try:
             upload_path = Path(settings.UPLOAD_DIR)
-            pattern = f"{document_id}_*.pdf"
-            matching_files = list(upload_path.glob(pattern))
+            matching_files = _find_document_files(upload_path, document_id)
             
             if not matching_files:
                 return None
@@ -181,6 +233,7 @@ class DocumentFileManager:
             
             pdf_files = list(upload_path.glob("*.pdf"))
             orphaned_count = 0
+            _clear_document_index(upload_path)
             
             for file_path in pdf_files:
                 # 파일명에서 document_id 추출
@@ -224,11 +277,17 @@ class DocumentFileManager:
                     "directory_exists": False
                 }
             
-            pdf_files = list(upload_path.glob("*.pdf"))
-            total_size = sum(f.stat().st_size for f in pdf_files if f.exists())
+            # Single directory scan; DirEntry caches stat info on most platforms
+            total_files = 0
+            total_size = 0
+            with os.scandir(upload_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".pdf") and not entry.name.startswith(".") and entry.is_file():
+                        total_files += 1
+                        total_size += entry.stat().st_size
             
             return {
-                "total_files": len(pdf_files),
+                "total_files": total_files,
                 "total_size_bytes": total_size,
                 "total_size_mb": round(total_size / (1024 * 1024), 2),
                 "directory_exists": True,
@@ -1,12 +1,26 @@
 """Application monitoring and health check utilities"""
 
 import time
+import numpy as np
 import psutil
 from typing import Dict, Any
 from app.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Number of recent processing times kept for averaging
+PROCESSING_TIMES_WINDOW = 1000
+
+# Seconds a psutil system stats snapshot is reused before being refreshed
+SYSTEM_STATS_TTL = 1.0
+
+# Seconds a full health check result is reused before the checks are re-run
+HEALTH_CHECK_TTL = 2.0
+
+# ChromaDB client settings, built lazily on the first database check so that
+# importing this module does not import chromadb
+_CHROMA_SETTINGS = None
+
 class PerformanceMonitor:
     """Monitor application performance metrics"""
     
@@ -14,28 +28,50 @@ class PerformanceMonitor:
         self.start_time = time.time()
         self.request_count = 0
         self.error_count = 0
-        self.processing_times = []
+        # Fixed-size ring buffer of recent requests as parallel arrays
+        # (processing time and error flag per slot)
+        self._times = np.zeros(PROCESSING_TIMES_WINDOW, dtype=np.float64)
+        self._errors = np.zeros(PROCESSING_TIMES_WINDOW, dtype=np.uint8)
+        self._head = 0
+        self._filled = 0
+        # System stats snapshot cache
+        self._sys_cache = None
+        self._sys_memory = None
+        self._sys_disk = None
+        self._sys_cache_ts = 0.0
+        self._sys_ttl = SYSTEM_STATS_TTL
+        # Health check result cache
+        self._health_cache = None
+        self._health_ts = 0.0
+        self._health_ttl = HEALTH_CHECK_TTL
+        # ChromaDB client reused across health checks
+        self._chroma_client = None
+        # Prime the CPU counter so non-blocking cpu_percent() calls are meaningful
+        psutil.cpu_percent(interval=None)
     
     def record_request(self, processing_time: float, error: bool = False):
         """Record a request with its processing time"""
         self.request_count += 1
-        if error:
-            self.error_count += 1
+        self.error_count += bool(error)
         
-        self.processing_times.append(processing_time)
-        
-        # Keep only last 1000 processing times for memory efficiency
-        if len(self.processing_times) > 1000:
-            self.processing_times = self.processing_times[-1000:]
+        # Overwrite the oldest slot
+        i = self._head
+        self._times[i] = processing_time
+        self._errors[i] = error
+        self._head = (i + 1) % PROCESSING_TIMES_WINDOW
+        self._filled = min(self._filled + 1, PROCESSING_TIMES_WINDOW)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get current performance statistics"""
         uptime = time.time() - self.start_time
         
-        # Calculate average processing time
+        # Recent metrics from the filled region of the ring buffer
+        filled = self._filled
         avg_processing_time = 0
-        if self.processing_times:
-            avg_processing_time = sum(self.processing_times) / len(self.processing_times)
+        recent_errors = 0
+        if filled:
+            avg_processing_time = float(self._times[:filled].mean())
+            recent_errors = int(self._errors[:filled].sum())
         
         # Get system metrics
         system_stats = self.get_system_stats()
@@ -46,26 +82,41 @@ class PerformanceMonitor:
             "total_errors": self.error_count,
             "error_rate": round(self.error_count / max(self.request_count, 1) * 100, 2),
             "avg_processing_time": round(avg_processing_time, 3),
-            "recent_requests": len(self.processing_times),
+            "recent_requests": filled,
+            "recent_errors": recent_errors,
             **system_stats
         }
     
+    def _get_system_snapshot(self) -> Dict[str, Any]:
+        """Return system resource usage, reusing a cached snapshot within the TTL"""
+        now = time.monotonic()
+        if self._sys_cache is not None and now - self._sys_cache_ts < self._sys_ttl:
+            return self._sys_cache
+        
+        # Non-blocking: CPU usage since the previous call
+        cpu_percent = psutil.cpu_percent(interval=None)
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+        
+        self._sys_cache = {
+            "cpu_usage_percent": round(cpu_percent, 1),
+            "memory_total_gb": round(memory.total / (1024**3), 2),
+            "memory_used_gb": round(memory.used / (1024**3), 2),
+            "memory_usage_percent": round(memory.percent, 1),
+            "disk_total_gb": round(disk.total / (1024**3), 2),
+            "disk_used_gb": round(disk.used / (1024**3), 2),
+            "disk_usage_percent": round(disk.percent, 1)
+        }
+        # Raw psutil results are kept so health checks can share the same reads
+        self._sys_memory = memory
+        self._sys_disk = disk
+        self._sys_cache_ts = now
+        return self._sys_cache
+    
     def get_system_stats(self) -> Dict[str, Any]:
         """Get system resource usage statistics"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
-            
-            return {
-                "cpu_usage_percent": round(cpu_percent, 1),
-                "memory_total_gb": round(memory.total / (1024**3), 2),
-                "memory_used_gb": round(memory.used / (1024**3), 2),
-                "memory_usage_percent": round(memory.percent, 1),
-                "disk_total_gb": round(disk.total / (1024**3), 2),
-                "disk_used_gb": round(disk.used / (1024**3), 2),
-                "disk_usage_percent": round(disk.percent, 1)
-            }
+            return dict(self._get_system_snapshot())
         except Exception as e:
             logger.error(f"Error getting system stats: {e}")
             return {
@@ -79,53 +130,83 @@ class PerformanceMonitor:
             }
     
     def check_health(self) -> Dict[str, Any]:
-        """Perform health checks"""
+        """Perform health checks (results are cached for a short TTL)"""
+        now = time.monotonic()
+        if self._health_cache is not None and now - self._health_ts < self._health_ttl:
+            return self._health_cache
+        
+        # Read memory/disk usage once per health cycle and share it with the checks
+        try:
+            self._get_system_snapshot()
+            memory, disk = self._sys_memory, self._sys_disk
+        except Exception as e:
+            logger.error(f"Error getting system stats: {e}")
+            memory = disk = None
+        
+        checks = {}
+        failed_checks = []
+        for name, check, args in (
+            ("database", self._check_database, ()),
+            ("memory", self._check_memory, (memory,)),
+            ("disk", self._check_disk, (disk,)),
+            ("error_rate", self._check_error_rate, ()),
+        ):
+            result = check(*args)
+            checks[name] = result
+            if not result["healthy"]:
+                failed_checks.append(name)
+        
         health_status = {
             "status": "healthy",
-            "checks": {
-                "database": self._check_database(),
-                "memory": self._check_memory(),
-                "disk": self._check_disk(),
-                "error_rate": self._check_error_rate()
-            }
+            "checks": checks
         }
         
         # Overall status based on individual checks
-        failed_checks = [check for check, status in health_status["checks"].items() if not status["healthy"]]
         if failed_checks:
             health_status["status"] = "unhealthy"
             health_status["failed_checks"] = failed_checks
         
+        self._health_cache = health_status
+        self._health_ts = now
         return health_status
     
     def _check_database(self) -> Dict[str, Any]:
         """Check database connectivity"""
         try:
-            # For ChromaDB, we'll check if we can import and create a client
-            import chromadb
-            from app.config import settings
-            
-            # Try to create a client - this will fail if ChromaDB is not accessible
-            client = chromadb.PersistentClient(
-                path=settings.CHROMA_DATA_PATH,
-                settings=chromadb.Settings(anonymized_telemetry=False)
-            )
-            collections = client.list_collections()
+            # Create the client once - this will fail if ChromaDB is not accessible
+            if self._chroma_client is None:
+                global _CHROMA_SETTINGS
+                import chromadb
+                from app.config import settings
+                
+                if _CHROMA_SETTINGS is None:
+                    _CHROMA_SETTINGS = chromadb.Settings(anonymized_telemetry=False)
+                self._chroma_client = chromadb.PersistentClient(
+                    path=settings.CHROMA_DATA_PATH,
+                    settings=_CHROMA_SETTINGS
+                )
+            collections = self._chroma_client.list_collections()
             
             return {
                 "healthy": True,
                 "message": f"Database accessible, {len(collections)} collections found"
             }
         except Exception as e:
+            # Drop the handle so the next probe re-opens the database
+            self._chroma_client = None
             return {
                 "healthy": False,
                 "message": f"Database check failed: {str(e)}"
             }
     
-    def _check_memory(self) -> Dict[str, Any]:
-        """Check memory usage"""
+    def _check_memory(self, memory) -> Dict[str, Any]:
+        """Check memory usage from a pre-fetched psutil.virtual_memory() result"""
+        if memory is None:
+            return {
+                "healthy": False,
+                "message": "Memory check failed: system stats unavailable"
+            }
         try:
-            memory = psutil.virtual_memory()
             if memory.percent > 90:
                 return {
                     "healthy": False,
@@ -141,10 +222,14 @@ class PerformanceMonitor:
                 "message": f"Memory check failed: {str(e)}"
             }
     
-    def _check_disk(self) -> Dict[str, Any]:
-        """Check disk usage"""
+    def _check_disk(self, disk) -> Dict[str, Any]:
+        """Check disk usage from a pre-fetched psutil.disk_usage() result"""
+        if disk is None:
+            return {
+                "healthy": False,
+                "message": "Disk check failed: system stats unavailable"
+            }
         try:
-            disk = psutil.disk_usage('/')
             if disk.percent > 90:
                 return {
                     "healthy": False,
@@ -1,12 +1,61 @@
 """
 Query validation utility for chat requests
 """
+import functools
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import List, NamedTuple, Optional, Tuple
 from app.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# 동일 질문 반복 시 검증/키워드 검사 결과를 재사용하기 위한 LRU 캐시 크기
+QUERY_CACHE_SIZE = 4096
+
+# Try to import pyahocorasick for multi-keyword matching, fall back to a compiled regex
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+
+def _build_keyword_matcher(keywords: List[str]):
+    """
+    키워드 중 하나라도 포함되어 있는지 한 번의 스캔으로 검사하는 함수 생성
+    
+    Args:
+        keywords: 검색할 키워드 목록 (생성 시 한 번만 소문자로 변환)
+        
+    Returns:
+        소문자로 변환된 텍스트를 받아 포함 여부를 반환하는 함수
+    """
+    lowered = [keyword.lower() for keyword in keywords]
+    
+    if HAS_AHOCORASICK:
+        automaton = ahocorasick.Automaton()
+        for keyword in lowered:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    
+    # 긴 키워드를 먼저 두어 교대(alternation) 매칭이 결정적으로 동작하도록 함
+    pattern = re.compile('|'.join(re.escape(keyword) for keyword in sorted(lowered, key=len, reverse=True)))
+    return lambda text: pattern.search(text) is not None
+
+
+class ValidationResult(NamedTuple):
+    """질문 검증 결과 (불변, 캐시된 인스턴스를 그대로 공유)"""
+    is_valid: bool
+    error_type: Optional[str] = None
+    suggestion: Optional[str] = None
+    
+    def __getitem__(self, key):
+        # 기존 dict 형식 호출(result['is_valid'])과의 호환
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+
 class QueryValidator:
     """질문 유효성 검증 클래스"""
     
@@ -14,30 +63,33 @@ class QueryValidator:
     MIN_QUERY_LENGTH = 2
     MAX_QUERY_LENGTH = 2000
     
-    # 유의미한 질문을 위한 최소 길이 (한국어 고려)
-    MIN_MEANINGFUL_LENGTH = 2
-    
-    # 한국어 문자 패턴
-    KOREAN_PATTERN = re.compile(r'[가-힣]')
-    
-    # 영어 문자 패턴  
-    ENGLISH_PATTERN = re.compile(r'[a-zA-Z]')
-    
-    # 숫자 패턴
-    NUMBER_PATTERN = re.compile(r'\d')
-    
-    # 의미없는 문자열 패턴 (키보드 무작위 입력 등)
-    MEANINGLESS_PATTERNS = [
-        re.compile(r'^[ㄱ-ㅎㅏ-ㅣ]+$'),  # 자음모음만
-        re.compile(r'^[ㅇㅇ]+$'),         # ㅇㅇ만 반복
-        re.compile(r'^[ㅎㅎ]+$'),         # ㅎㅎ만 반복
-        re.compile(r'^[ㅋㅋ]+$'),         # ㅋㅋ만 반복
-        re.compile(r'^[.,!?;:\s]+$'),     # 구두점과 공백만
-        re.compile(r'^[12345]+$'),        # 숫자만 연속
-        re.compile(r'^[qwerty]+$', re.IGNORECASE),  # 키보드 연속 타이핑
-        re.compile(r'^[asdf]+$', re.IGNORECASE),
-        re.compile(r'^[zxcv]+$', re.IGNORECASE),
-    ]
+    # 한국어 또는 영어 문자 패턴 (첫 글자에서 바로 종료되는 단일 스캔)
+    _HAS_KO_EN_RE = re.compile(r'[가-힣a-zA-Z]')
+    
+    # 의미없는 문자열 패턴 (키보드 무작위 입력 등)을 하나의 정규식으로 결합
+    # - 자음모음만 (ㅇㅇ, ㅎㅎ, ㅋㅋ 반복 포함)
+    # - 구두점과 공백만
+    # - 숫자만 연속
+    # - 키보드 연속 타이핑 (qwerty, asdf, zxcv)
+    _MEANINGLESS_RE = re.compile(
+        r'^(?:[ㄱ-ㅎㅏ-ㅣ]+|[.,!?;:\s]+|[12345]+|[qwerty]+|[asdf]+|[zxcv]+)$',
+        re.IGNORECASE
+    )
+    
+    # 고정된 검증 결과는 한 번만 생성해 재사용
+    _VALID_RESULT = ValidationResult(True)
+    _EMPTY_RESULT = ValidationResult(False, 'empty_query', '질문을 입력해주세요.')
+    _BLANK_RESULT = ValidationResult(False, 'empty_query', '공백이 아닌 질문을 입력해주세요.')
+    _TOO_SHORT_RESULT = ValidationResult(
+        False, 'too_short', f'질문이 너무 짧습니다. 최소 {MIN_QUERY_LENGTH}자 이상 입력해주세요.'
+    )
+    _TOO_LONG_RESULT = ValidationResult(
+        False, 'too_long', f'질문이 너무 깁니다. 최대 {MAX_QUERY_LENGTH}자 이하로 입력해주세요.'
+    )
+    _MEANINGLESS_RESULT = ValidationResult(
+        False, 'meaningless_input', '의미있는 질문을 입력해주세요. 예: "주물 결함의 종류가 뭐야?", "알루미늄 주조 온도는?"'
+    )
+    _NO_TEXT_RESULT = ValidationResult(False, 'no_meaningful_text', '한국어 또는 영어로 질문을 입력해주세요.')
     
     # 의미있는 키워드 패턴 (주조 기술 관련)
     FOUNDRY_KEYWORDS = [
@@ -50,8 +102,17 @@ class QueryValidator:
         'temperature', 'alloy', 'metal', 'iron', 'aluminum'
     ]
     
+    # 키워드 매처는 클래스 로드 시 한 번만 생성
+    # (C 레벨 단일 스캔이므로 Python 측 bloom/첫 글자 사전 필터는 오히려 느림)
+    _foundry_match = staticmethod(_build_keyword_matcher(FOUNDRY_KEYWORDS))
+    
+    # 맞춤 제안용 키워드 (순수 리터럴이므로 정규식 대신 부분 문자열 검사)
+    _DEFECT_KEYWORDS = ('결함', 'defect')
+    _TEMP_KEYWORDS = ('온도', 'temperature')
+    _ALU_KEYWORDS = ('알루미늄', 'aluminum')
+    
     @classmethod
-    def validate_query(cls, query: str) -> Dict[str, any]:
+    def validate_query(cls, query: str) -> ValidationResult:
         """
         질문의 유효성을 종합적으로 검증
         
@@ -59,80 +120,47 @@ class QueryValidator:
             query: 사용자 질문
             
         Returns:
-            Dict: 검증 결과 {'is_valid': bool, 'error_type': str, 'suggestion': str}
+            ValidationResult: 검증 결과 (is_valid, error_type, suggestion)
         """
+        query = query or ""
+        if len(query) > cls.MAX_QUERY_LENGTH:
+            # 길이 제한을 넘는 입력은 캐시 키로 보관하지 않음 (strip 후 길이 판정은 본체에서 동일하게 수행)
+            return cls._validate_query_cached.__wrapped__(cls, query)
+        return cls._validate_query_cached(query)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=QUERY_CACHE_SIZE)
+    def _validate_query_cached(cls, query: str) -> ValidationResult:
+        """validate_query 본체 - 미리 생성된 결과 상수 중 하나를 반환"""
         if not query:
-            return {
-                'is_valid': False,
-                'error_type': 'empty_query',
-                'suggestion': '질문을 입력해주세요.'
-            }
+            return cls._EMPTY_RESULT
         
         # 공백 제거 후 재검증
         clean_query = query.strip()
         if not clean_query:
-            return {
-                'is_valid': False,
-                'error_type': 'empty_query',
-                'suggestion': '공백이 아닌 질문을 입력해주세요.'
-            }
-        
-        # 길이 검증
-        if len(clean_query) < cls.MIN_QUERY_LENGTH:
-            return {
-                'is_valid': False,
-                'error_type': 'too_short',
-                'suggestion': f'질문이 너무 짧습니다. 최소 {cls.MIN_QUERY_LENGTH}자 이상 입력해주세요.'
-            }
-        
-        if len(clean_query) > cls.MAX_QUERY_LENGTH:
-            return {
-                'is_valid': False,
-                'error_type': 'too_long',
-                'suggestion': f'질문이 너무 깁니다. 최대 {cls.MAX_QUERY_LENGTH}자 이하로 입력해주세요.'
-            }
+            return cls._BLANK_RESULT
+        
+        # 길이 검증 (가장 저렴한 검사부터 수행)
+        n = len(clean_query)
+        if n < cls.MIN_QUERY_LENGTH:
+            return cls._TOO_SHORT_RESULT
+        
+        if n > cls.MAX_QUERY_LENGTH:
+            return cls._TOO_LONG_RESULT
         
         # 의미없는 패턴 검사
-        for pattern in cls.MEANINGLESS_PATTERNS:
-            if pattern.match(clean_query):
-                return {
-                    'is_valid': False,
-                    'error_type': 'meaningless_input',
-                    'suggestion': '의미있는 질문을 입력해주세요. 예: "주물 결함의 종류가 뭐야?", "알루미늄 주조 온도는?"'
-                }
-        
-        # 의미있는 내용 검증 (주조 기술 키워드는 예외 처리)
-        if len(clean_query) < cls.MIN_MEANINGFUL_LENGTH:
-            # 주조 기술 관련 핵심 키워드는 허용
-            foundry_core_keywords = ['주조', '주물', '용해', '탕구', '결함', 'casting', 'foundry']
-            is_core_keyword = any(keyword in clean_query.lower() for keyword in foundry_core_keywords)
-            
-            if not is_core_keyword:
-                return {
-                    'is_valid': False,
-                    'error_type': 'too_short_meaningful',
-                    'suggestion': '더 구체적인 질문을 해주세요. 예: "주조 온도는?", "결함 종류는?"'
-                }
+        # 두 정규식 모두 C 레벨에서 판별 가능한 첫 문자에서 종료되므로 일반 질문은
+        # 사실상 한 번만 스캔됨 (단일 정규식/문자 단위 루프로 합치면 오히려 느려짐)
+        if cls._MEANINGLESS_RE.match(clean_query):
+            return cls._MEANINGLESS_RESULT
         
         # 문자 구성 검증 (완전히 무의미한 입력 방지)
-        has_korean = bool(cls.KOREAN_PATTERN.search(clean_query))
-        has_english = bool(cls.ENGLISH_PATTERN.search(clean_query))
-        has_number = bool(cls.NUMBER_PATTERN.search(clean_query))
-        
         # 최소한 한국어 또는 영어가 포함되어야 함
-        if not has_korean and not has_english:
-            return {
-                'is_valid': False,
-                'error_type': 'no_meaningful_text',
-                'suggestion': '한국어 또는 영어로 질문을 입력해주세요.'
-            }
+        if not cls._HAS_KO_EN_RE.search(clean_query):
+            return cls._NO_TEXT_RESULT
         
         # 유효한 질문으로 판단
-        return {
-            'is_valid': True,
-            'error_type': None,
-            'suggestion': None
-        }
+        return cls._VALID_RESULT
     
     @classmethod
     def is_foundry_related(cls, query: str) -> bool:
@@ -145,13 +173,24 @@ class QueryValidator:
         Returns:
             bool: 주조 기술 관련 여부
         """
-        query_lower = query.lower()
-        
-        for keyword in cls.FOUNDRY_KEYWORDS:
-            if keyword.lower() in query_lower:
-                return True
-        
-        return False
+        if len(query) > cls.MAX_QUERY_LENGTH:
+            return cls._is_foundry_related_cached.__wrapped__(cls, query)
+        return cls._is_foundry_related_cached(query)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=QUERY_CACHE_SIZE)
+    def _is_foundry_related_cached(cls, query: str) -> bool:
+        """is_foundry_related 본체"""
+        return cls._foundry_match(query.lower())
+    
+    # 기본 제안 질문들
+    _BASIC_SUGGESTIONS = (
+        "주물 결함의 주요 종류는 무엇인가요?",
+        "알루미늄 주조 시 적정 온도는?",
+        "사형 주조와 금형 주조의 차이점은?",
+        "주조품의 품질 검사 방법은?",
+        "용탕 처리 방법에 대해 설명해주세요"
+    )
     
     @classmethod
     def get_query_suggestions(cls, query: str) -> List[str]:
@@ -164,47 +203,48 @@ class QueryValidator:
         Returns:
             List[str]: 제안 질문 목록
         """
-        suggestions = []
-        
-        # 기본 제안 질문들
-        basic_suggestions = [
-            "주물 결함의 주요 종류는 무엇인가요?",
-            "알루미늄 주조 시 적정 온도는?",
-            "사형 주조와 금형 주조의 차이점은?",
-            "주조품의 품질 검사 방법은?",
-            "용탕 처리 방법에 대해 설명해주세요"
-        ]
-        
+        query = query or ""
+        if len(query) > cls.MAX_QUERY_LENGTH:
+            # 길이 제한을 넘는 입력은 캐시 키로 보관하지 않음
+            return list(cls._get_query_suggestions_cached.__wrapped__(cls, query))
+        # 캐시된 결과는 불변 튜플로 공유하고, 호출자에게는 새 list를 반환
+        return list(cls._get_query_suggestions_cached(query))
+    
+    @classmethod
+    @functools.lru_cache(maxsize=QUERY_CACHE_SIZE)
+    def _get_query_suggestions_cached(cls, query: str) -> Tuple[str, ...]:
+        """get_query_suggestions 본체 - 제안 질문 튜플 반환"""
         # 질문이 너무 짧거나 의미없는 경우 기본 제안
-        validation = cls.validate_query(query)
-        if not validation['is_valid']:
-            return basic_suggestions
+        if not cls.validate_query(query).is_valid:
+            return cls._BASIC_SUGGESTIONS
+        
+        suggestions = []
         
         # 키워드 기반 맞춤 제안
         query_lower = query.lower()
         
-        if any(kw in query_lower for kw in ['결함', 'defect']):
+        if any(k in query_lower for k in cls._DEFECT_KEYWORDS):
             suggestions.extend([
                 "주물 결함의 종류와 원인은?",
                 "기공 결함을 방지하는 방법은?",
                 "수축 결함이 발생하는 이유는?"
             ])
         
-        if any(kw in query_lower for kw in ['온도', 'temperature']):
+        if any(k in query_lower for k in cls._TEMP_KEYWORDS):
             suggestions.extend([
                 "주조 온도 설정 기준은?",
                 "용해 온도와 주입 온도의 차이는?",
                 "온도가 주조품 품질에 미치는 영향은?"
             ])
         
-        if any(kw in query_lower for kw in ['알루미늄', 'aluminum']):
+        if any(k in query_lower for k in cls._ALU_KEYWORDS):
             suggestions.extend([
                 "알루미늄 합금의 특성은?",
                 "알루미늄 주조 시 주의사항은?",
                 "알루미늄 용해 온도는?"
             ])
         
-        return suggestions[:5] if suggestions else basic_suggestions
+        return tuple(suggestions[:5]) if suggestions else cls._BASIC_SUGGESTIONS
     
     @classmethod
     def enhance_query_for_search(cls, query: str) -> str:
@@ -217,6 +257,14 @@ class QueryValidator:
         Returns:
             str: 향상된 질문
         """
+        if len(query) > cls.MAX_QUERY_LENGTH:
+            return cls._enhance_query_cached.__wrapped__(cls, query)
+        return cls._enhance_query_cached(query)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=QUERY_CACHE_SIZE)
+    def _enhance_query_cached(cls, query: str) -> str:
+        """enhance_query_for_search 본체"""
         # 기본 정제
         enhanced = query.strip()
         
@@ -228,4 +276,12 @@ class QueryValidator:
         if not cls.is_foundry_related(enhanced):
             enhanced = f"주조 기술에서 {enhanced}"
         
-        return enhanced
\ No newline at end of file
+        return enhanced
+    
+    @classmethod
+    def cache_clear(cls) -> None:
+        """검증 결과 캐시 초기화 (테스트 및 설정 변경 시 사용)"""
+        cls._validate_query_cached.cache_clear()
+        cls._is_foundry_related_cached.cache_clear()
+        cls._enhance_query_cached.cache_clear()
+        cls._get_query_suggestions_cached.cache_clear()
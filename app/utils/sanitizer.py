@@ -2,11 +2,15 @@
 
 import re
 import html
+from functools import lru_cache
 from typing import Optional
 from app.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Number of recent sanitized LLM responses kept for re-renders of the same message
+SANITIZE_CACHE_SIZE = 256
+
 class ContentSanitizer:
     """Sanitizes content to prevent XSS and other injection attacks"""
     
@@ -33,6 +37,37 @@ class ContentSanitizer:
         r'on\w+\s*=',  # Event handlers like onclick, onload, etc.
     ]
     
+    # Pre-compiled patterns. Dangerous patterns stay separate and run in order:
+    # each pass must see the previous pass's output, otherwise removing one
+    # token (e.g. '<input>') can splice a new one ('javascript:') together.
+    _DANGEROUS_RES = tuple(re.compile(p, re.IGNORECASE | re.DOTALL) for p in DANGEROUS_PATTERNS)
+    _TAG_RE = re.compile(r'<(/?)(\w+)[^>]*>')
+    _UNSAFE_LT_RE = re.compile(r'<(?!/?(p|br|strong|b|em|i|u|code|pre|h[1-6]|ul|ol|li|blockquote|table|thead|tbody|tr|th|td)(?:\s[^>]*)?>)')
+    # Markdown links and images (leading '!') with dangerous protocols in one pattern
+    _MD_DANGEROUS_LINK_RE = re.compile(r'(!?)\[([^\]]*)\]\((?:javascript:|vbscript:|data:text/html)[^)]*\)', re.IGNORECASE)
+    
+    @classmethod
+    def _remove_dangerous_patterns(cls, content: str) -> str:
+        """Strip every dangerous pattern, one pass per pattern in list order"""
+        for pattern in cls._DANGEROUS_RES:
+            content = pattern.sub('', content)
+        return content
+    
+    @classmethod
+    def _replace_md_link(cls, match: re.Match) -> str:
+        """Keep only the text of dangerous links; label dangerous images"""
+        if match.group(1):
+            return f'[Image: {match.group(2)}]'
+        return match.group(2)
+    
+    @classmethod
+    def _replace_tag(cls, match: re.Match) -> str:
+        """Keep allowed tags, drop everything else"""
+        tag_name = match.group(2).lower()
+        if tag_name in cls.ALLOWED_TAGS:
+            return match.group(0)
+        return ''
+    
     @classmethod
     def sanitize_html_content(cls, content: str) -> str:
         """
@@ -49,27 +84,15 @@ class ContentSanitizer:
         
         try:
             # Remove dangerous patterns
-            sanitized = content
-            for pattern in cls.DANGEROUS_PATTERNS:
-                sanitized = re.sub(pattern, '', sanitized, flags=re.IGNORECASE | re.DOTALL)
+            sanitized = cls._remove_dangerous_patterns(content)
             
             # Remove any tags not in allowed list
             # This is a simple approach - for production, consider using a proper HTML sanitizer library
-            tag_pattern = r'<(/?)(\w+)[^>]*>'
-            
-            def replace_tag(match):
-                closing = match.group(1)
-                tag_name = match.group(2).lower()
-                if tag_name in cls.ALLOWED_TAGS:
-                    return match.group(0)
-                else:
-                    return ''
-            
-            sanitized = re.sub(tag_pattern, replace_tag, sanitized)
+            sanitized = cls._TAG_RE.sub(cls._replace_tag, sanitized)
             
             # Escape any remaining < > characters that aren't part of allowed tags
             # This helps prevent any missed XSS attempts
-            sanitized = re.sub(r'<(?!/?(p|br|strong|b|em|i|u|code|pre|h[1-6]|ul|ol|li|blockquote|table|thead|tbody|tr|th|td)(?:\s[^>]*)?>)', '&lt;', sanitized)
+            sanitized = cls._UNSAFE_LT_RE.sub('&lt;', sanitized)
             
             logger.debug(f"Sanitized HTML content: {len(content)} -> {len(sanitized)} chars")
             return sanitized
@@ -111,19 +134,11 @@ class ContentSanitizer:
             return ""
         
         try:
-            # Remove dangerous markdown patterns
-            sanitized = content
-            
             # Remove HTML script tags and dangerous elements
-            for pattern in cls.DANGEROUS_PATTERNS:
-                sanitized = re.sub(pattern, '', sanitized, flags=re.IGNORECASE | re.DOTALL)
+            sanitized = cls._remove_dangerous_patterns(content)
             
-            # Remove markdown link patterns that could be dangerous
-            # Remove links with javascript: or data: protocols
-            sanitized = re.sub(r'\[([^\]]*)\]\((?:javascript:|vbscript:|data:text/html)[^)]*\)', r'\1', sanitized, flags=re.IGNORECASE)
-            
-            # Remove image sources with dangerous protocols
-            sanitized = re.sub(r'!\[([^\]]*)\]\((?:javascript:|vbscript:|data:text/html)[^)]*\)', r'[Image: \1]', sanitized, flags=re.IGNORECASE)
+            # Remove markdown links and image sources with dangerous protocols (single pass)
+            sanitized = cls._MD_DANGEROUS_LINK_RE.sub(cls._replace_md_link, sanitized)
             
             logger.debug(f"Sanitized markdown content: {len(content)} -> {len(sanitized)} chars")
             return sanitized
@@ -147,6 +162,12 @@ def sanitize_llm_response(response: str, content_type: str = "markdown") -> str:
     if not response:
         return ""
     
+    return _sanitize_llm_response_cached(response, content_type)
+
+
+@lru_cache(maxsize=SANITIZE_CACHE_SIZE)
+def _sanitize_llm_response_cached(response: str, content_type: str) -> str:
+    """Run the sanitizer for a content type (cached on the full response string)"""
     if content_type == "markdown":
         return ContentSanitizer.sanitize_markdown_content(response)
     elif content_type == "html":
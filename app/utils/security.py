@@ -1,7 +1,9 @@
 """Security utilities for file validation and safety checks"""
 
+import functools
 import hashlib
 import os
+import unicodedata
 from pathlib import Path
 from typing import Optional, List
 from app.config import settings
@@ -10,6 +12,25 @@ from app.utils.exceptions import ValidationError
 
 logger = get_logger(__name__)
 
+# str.translate table for safe filenames: drop control characters and replace
+# characters that are problematic for file systems (NUL included) with '_'
+_FILENAME_TRANS = {c: None for c in range(32)}
+_FILENAME_TRANS.update({ord(c): '_' for c in '/\\:*?"<>|\x00'})
+
+# Characters not allowed in document IDs (forbidden + control characters) are
+# deleted, so an ID is valid iff translating it leaves it unchanged
+_FORBIDDEN_TRANS = dict.fromkeys(_FILENAME_TRANS)
+
+# Control characters removed from free-text input (tab/newline/CR are kept)
+_CONTROL_TRANS = dict.fromkeys(c for c in range(32) if c not in (9, 10, 13))
+_CONTROL_TRANS[0x7f] = None
+
+# Read buffer for streaming file hashes (reused for the whole file)
+HASH_BUFFER_SIZE = 1 << 20
+
+# Document IDs repeat across requests (chat filters, delete/info lookups)
+DOCUMENT_ID_CACHE_SIZE = 4096
+
 # Try to import python-magic, fall back if not available
 try:
     import magic
@@ -19,6 +40,13 @@ except ImportError:
     HAS_MAGIC = False
     logger.warning("python-magic not available. MIME type validation will be skipped.")
 
+# Try to import blake3 for fast file hashing, fall back to SHA256
+try:
+    from blake3 import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
 class FileValidator:
     """File upload validation and security checks"""
     
@@ -64,15 +92,19 @@ class FileValidator:
     def _validate_pdf_signature(file_path: str) -> bool:
         """Validate PDF file by checking file signature (magic bytes)"""
         try:
-            with open(file_path, 'rb') as f:
-                header = f.read(8)
-                # PDF files start with %PDF- (0x255044462D)
-                if header.startswith(b'%PDF-'):
-                    logger.debug(f"Valid PDF signature detected for: {file_path}")
-                    return True
-                else:
-                    logger.warning(f"Invalid PDF signature for: {file_path}. Header: {header[:8]}")
-                    return False
+            # Raw fd read: skips the buffered file object for an 8-byte header
+            fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                header = os.read(fd, 8)
+            finally:
+                os.close(fd)
+            # PDF files start with %PDF- (0x255044462D)
+            if header.startswith(b'%PDF-'):
+                logger.debug(f"Valid PDF signature detected for: {file_path}")
+                return True
+            else:
+                logger.warning(f"Invalid PDF signature for: {file_path}. Header: {header[:8]}")
+                return False
         except Exception as e:
             logger.error(f"Error reading file signature for {file_path}: {e}")
             return False
@@ -80,15 +112,10 @@ class FileValidator:
     @staticmethod
     def generate_safe_filename(original_filename: str, document_id: str) -> str:
         """Generate a safe filename"""
-        # Remove only problematic characters for file systems
-        forbidden_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|', '\0']
-        safe_filename = original_filename
-        
-        for char in forbidden_chars:
-            safe_filename = safe_filename.replace(char, '_')
-        
-        # Remove control characters
-        safe_filename = ''.join(c for c in safe_filename if ord(c) >= 32)
+        # Compose decomposed Hangul (NFD names from macOS uploads) so names and
+        # length limits match what users typed, then replace problematic
+        # characters for file systems and remove control characters
+        safe_filename = unicodedata.normalize("NFC", original_filename).translate(_FILENAME_TRANS)
         
         # Calculate maximum allowed length for the original filename part
         # considering the document_id prefix and underscore separator
@@ -110,14 +137,37 @@ class FileValidator:
         return f"{document_id}_{safe_filename}"
     
     @staticmethod
-    def calculate_file_hash(file_path: str) -> str:
-        """Calculate SHA256 hash of file"""
-        hash_sha256 = hashlib.sha256()
+    def calculate_file_hash(file_path: str, algorithm: Optional[str] = None) -> str:
+        """
+        Calculate a 64-character hex hash of file for identity/dedup
+        
+        Uses BLAKE3 (multithreaded, SIMD) when configured and installed,
+        otherwise SHA256. Pass algorithm="sha256" where cryptographic
+        strength is required.
+        """
+        algorithm = (algorithm or settings.FILE_HASH_ALGORITHM).lower()
         try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_sha256.update(chunk)
-            return hash_sha256.hexdigest()
+            if algorithm == "blake3" and HAS_BLAKE3:
+                hasher = blake3(max_threads=blake3.AUTO)
+                hasher.update_mmap(file_path)
+                return hasher.hexdigest()
+            
+            # Unbuffered FileIO: readinto() fills the hash buffer straight from the kernel
+            with open(file_path, "rb", buffering=0) as f:
+                if hasattr(hashlib, "file_digest"):
+                    # Python 3.11+: readinto() into one reused buffer; the loop itself is Python
+                    return hashlib.file_digest(f, "sha256").hexdigest()
+                
+                # One reusable buffer: no per-chunk bytes allocations
+                hash_sha256 = hashlib.sha256()
+                buf = bytearray(HASH_BUFFER_SIZE)
+                view = memoryview(buf)
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    hash_sha256.update(view[:n])
+                return hash_sha256.hexdigest()
         except Exception as e:
             logger.error(f"Error calculating hash for {file_path}: {e}")
             return ""
@@ -153,11 +203,10 @@ class FileValidator:
             validation_result["is_valid"] = False
             validation_result["errors"].append("Invalid file type. Only PDF files are allowed.")
         
-        # Calculate file hash for integrity
-        file_hash = cls.calculate_file_hash(file_path)
-        validation_result["file_hash"] = file_hash
-        
         if validation_result["is_valid"]:
+            # Calculate file hash for integrity (skipped for rejected files)
+            file_hash = cls.calculate_file_hash(file_path)
+            validation_result["file_hash"] = file_hash
             logger.info(f"File validation passed for: {original_filename}")
         else:
             logger.warning(f"File validation failed for: {original_filename}. Errors: {validation_result['errors']}")
@@ -169,8 +218,8 @@ def sanitize_input(text: str, max_length: int = 1000) -> str:
     if not text:
         return ""
     
-    # Remove potentially dangerous characters
-    sanitized = text.strip()
+    # Remove potentially dangerous characters (C-level translate, no per-char loop)
+    sanitized = text.translate(_CONTROL_TRANS).strip()
     
     # Limit length
     if len(sanitized) > max_length:
@@ -179,8 +228,9 @@ def sanitize_input(text: str, max_length: int = 1000) -> str:
     
     return sanitized
 
+@functools.lru_cache(maxsize=DOCUMENT_ID_CACHE_SIZE)
 def validate_document_id(document_id: str) -> bool:
-    """Validate document ID format"""
+    """Validate document ID format (memoized; the result depends only on the ID)"""
     if not document_id:
         return False
     
@@ -190,15 +240,5 @@ def validate_document_id(document_id: str) -> bool:
     
     # Allow alphanumeric characters, hyphens, underscores, dots, and Korean characters
     # Also allow some common symbols found in document names
-    forbidden_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|', '\0']
-    
-    # Check for forbidden characters
-    for char in forbidden_chars:
-        if char in document_id:
-            return False
-    
-    # Check for control characters
-    if any(ord(char) < 32 for char in document_id):
-        return False
-    
-    return True
\ No newline at end of file
+    # Reject forbidden and control characters in a single pass
+    return document_id.translate(_FORBIDDEN_TRANS) == document_id
\ No newline at end of file
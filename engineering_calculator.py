@@ -1,6 +1,48 @@
+import ast
+import math
+import operator
 import tkinter as tk
 from tkinter import ttk
 
+# Single-argument function buttons
+_OPS = {
+    'sin': math.sin,
+    'cos': math.cos,
+    'tan': math.tan,
+    'log': math.log10,
+    'ln': math.log,
+    '√': math.sqrt,
+}
+_PI = str(math.pi)
+
+# Arithmetic operators allowed in '=' expressions
+_BIN_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+_UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+def _eval_node(node):
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BIN_OPS:
+        return _BIN_OPS[type(node.op)](_eval_node(node.left), _eval_node(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        return _UNARY_OPS[type(node.op)](_eval_node(node.operand))
+    raise ValueError("Unsupported expression")
+
+
+def safe_eval(expression):
+    """Evaluate an arithmetic expression (numbers, + - * /) without eval()"""
+    return _eval_node(ast.parse(expression, mode='eval').body)
+
+
 class EngineeringCalculator:
     def __init__(self, root):
         self.root = root
@@ -44,16 +86,16 @@ class EngineeringCalculator:
             self.display_var.set("0")
         elif button_text == '=':
             try:
-                result = eval(current)
-                self.display_var.set(str(result))
-            except:
+                self.display_var.set(str(safe_eval(current)))
+            except Exception:
                 self.display_var.set("Error")
-        elif button_text == '√':
-            self.display_var.set(str(eval(f"math.sqrt({current})")))
         elif button_text == 'π':
-            self.display_var.set(str(math.pi))
-        elif button_text in ['sin', 'cos', 'tan', 'log', 'ln']:
-            self.display_var.set(str(eval(f"math.{button_text}({current})")))
+            self.display_var.set(_PI)
+        elif button_text in _OPS:
+            try:
+                self.display_var.set(str(_OPS[button_text](safe_eval(current))))
+            except Exception:
+                self.display_var.set("Error")
         else:
             if current == "0" or current == "Error":
                 self.display_var.set(button_text)
@@ -61,7 +103,6 @@ class EngineeringCalculator:
                 self.display_var.set(current + button_text)
 
 if __name__ == "__main__":
-    import math
     root = tk.Tk()
     app = EngineeringCalculator(root)
     root.mainloop()
\ No newline at end of file
@@ -6,13 +6,34 @@ KITECH RAG Chatbot 서버 시작 스크립트
 
 import os
 import sys
-import subprocess
 import signal
-import time
+import socket
 import psutil
 
+def _port_free(port):
+    """포트에 바인드 가능한지 확인 (uvicorn과 같이 SO_REUSEADDR 사용)"""
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        s.bind(('0.0.0.0', port))
+        return True
+    except OSError:
+        return False
+    finally:
+        s.close()
+
 def find_process_by_port(port):
     """지정된 포트를 사용하는 프로세스 찾기"""
+    # 시스템 전체 소켓 목록을 한 번에 조회 (프로세스별 조회 대비 syscall 대폭 감소)
+    try:
+        for conn in psutil.net_connections(kind='inet'):
+            if conn.laddr and conn.laddr.port == port and conn.pid:
+                return conn.pid
+        return None
+    except psutil.AccessDenied:
+        # macOS 등 권한이 필요한 환경에서는 프로세스별 조회로 대체
+        pass
+    
     for proc in psutil.process_iter(['pid', 'name']):
         try:
             connections = proc.connections()
@@ -35,12 +56,13 @@ def kill_process_by_port(port):
             process = psutil.Process(pid)
             process.terminate()  # SIGTERM 먼저 시도
             
-            # 3초 대기 후 강제 종료
-            time.sleep(3)
-            if process.is_running():
+            # 종료되는 즉시 반환, 3초 내에 종료되지 않으면 강제 종료
+            try:
+                process.wait(timeout=3)
+            except psutil.TimeoutExpired:
                 process.kill()  # SIGKILL로 강제 종료
+                process.wait(timeout=1)
             
-            time.sleep(1)
             print("✅ 프로세스가 성공적으로 종료되었습니다.")
             return True
         except psutil.NoSuchProcess:
@@ -83,16 +105,19 @@ def start_server():
     print("")
     
     try:
-        # uvicorn 서버 실행
-        subprocess.run([
-            "uvicorn", "app.main:app", 
-            "--reload", 
-            "--host", "0.0.0.0", 
-            "--port", "8000"
-        ], check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"❌ 서버 실행 중 오류 발생: {e}")
-        sys.exit(1)
+        # uvicorn 서버를 현재 프로세스에서 실행 (별도 인터프리터 기동 없음)
+        import uvicorn
+        uvicorn.run(
+            "app.main:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True
+        )
+    except SystemExit as e:
+        # uvicorn은 설정/기동 오류 시 SystemExit를 발생시킴
+        if e.code:
+            print(f"❌ 서버 실행 중 오류 발생: {e}")
+        sys.exit(e.code)
     except KeyboardInterrupt:
         print("\n🛑 서버가 중지되었습니다.")
         sys.exit(0)
@@ -109,8 +134,11 @@ def main():
         sys.exit(1)
     
     # 3. 기존 포트 8000 프로세스 종료
+    # 포트가 비어 있으면 프로세스 검색을 생략
     print("🔍 포트 8000 사용 중인 프로세스 확인 중...")
-    if not kill_process_by_port(8000):
+    if _port_free(8000):
+        print("✅ 포트 8000이 사용 가능합니다.")
+    elif not kill_process_by_port(8000):
         sys.exit(1)
     
     # 4. 서버 시작
@@ -1,8 +1,32 @@
 import pytest
 import os
+from types import SimpleNamespace
+from fastapi.testclient import TestClient
 
 @pytest.fixture(scope="session", autouse=True)
 def set_test_env():
     os.environ["DEBUG"] = "True"
     yield
-    del os.environ["DEBUG"]
\ No newline at end of file
+    del os.environ["DEBUG"]
+
+@pytest.fixture
+def temp_dir(tmp_path):
+    """Per-test scratch directory as a str (backed by tmp_path_factory, cleaned up lazily)"""
+    return str(tmp_path)
+
+@pytest.fixture(scope="session")
+def client():
+    """Single TestClient for the whole session (app lifespan runs once)"""
+    from app.main import app
+    with TestClient(app, base_url="http://localhost") as c:
+        yield c
+
+@pytest.fixture
+def chat_mocks(mocker):
+    """Common chat router dependencies, patched once per test (override return_value as needed)"""
+    return SimpleNamespace(
+        embeddings=mocker.patch('app.api.routers.chat.get_embeddings', return_value=[[0.1, 0.2, 0.3]]),
+        search=mocker.patch('app.api.routers.chat.search_multimodal_content',
+                            return_value={'text': [], 'images': [], 'tables': []}),
+        llm=mocker.patch('app.api.routers.chat.process_multimodal_llm_chat_request', return_value="response"),
+    )
\ No newline at end of file
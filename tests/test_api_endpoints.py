@@ -2,18 +2,24 @@
 
 import pytest
 import asyncio
-from fastapi.testclient import TestClient
+from types import MappingProxyType
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
-from app.main import app
 from app.api.routers.chat import ChatRequest
 
-client = TestClient(app, base_url="http://localhost")
+# Shared upload payloads (read-only so a test cannot mutate them for others)
+_PDF_BYTES = b"%PDF-1.4\ntest content\n%%EOF"
+_EMPTY_BYTES = b""
+_UPLOAD_DATA = MappingProxyType({
+    "ocr_correction_enabled": "false",
+    "llm_correction_enabled": "false"
+})
 
+@pytest.mark.slow
 class TestUploadEndpoint:
     
     @patch('app.api.routers.upload.FileValidator.validate_uploaded_file')
     @patch('app.api.routers.upload.process_pdf_background')
-    def test_upload_pdf_success(self, mock_process, mock_validator):
+    def test_upload_pdf_success(self, mock_process, mock_validator, client):
         """Test successful PDF upload"""
         # Mock validation
         mock_validator.return_value = {
@@ -22,18 +28,12 @@ class TestUploadEndpoint:
             "file_hash": "test_hash"
         }
         
-        # Create a test PDF file
-        test_pdf_content = b"%PDF-1.4\ntest content\n%%EOF"
-        
         response = client.post(
             "/api/upload_pdf/",
             files={
-                "files": ("test.pdf", test_pdf_content, "application/pdf")
+                "files": ("test.pdf", _PDF_BYTES, "application/pdf")
             },
-            data={
-                "ocr_correction_enabled": "false",
-                "llm_correction_enabled": "false"
-            }
+            data=_UPLOAD_DATA
         )
         
         assert response.status_code == 202
@@ -45,7 +45,7 @@ class TestUploadEndpoint:
         assert "file_hash" in result
         assert result["filename"] == "test.pdf"
     
-    def test_upload_invalid_file_type(self):
+    def test_upload_invalid_file_type(self, client):
         """Test upload with invalid file type — returns 202 with error in results"""
         test_content = b"not a pdf"
         
@@ -54,10 +54,7 @@ class TestUploadEndpoint:
             files={
                 "files": ("test.txt", test_content, "text/plain")
             },
-            data={
-                "ocr_correction_enabled": "false",
-                "llm_correction_enabled": "false"
-            }
+            data=_UPLOAD_DATA
         )
         
         # Multi-file endpoint always returns 202; per-file errors in results
@@ -67,17 +64,14 @@ class TestUploadEndpoint:
         assert "error" in result
         assert "validation failed" in result["error"].lower() or "File validation failed" in result["error"]
     
-    def test_upload_empty_file(self):
+    def test_upload_empty_file(self, client):
         """Test upload with empty file — returns 202 with error in results"""
         response = client.post(
             "/api/upload_pdf/",
             files={
-                "files": ("test.pdf", b"", "application/pdf")
+                "files": ("test.pdf", _EMPTY_BYTES, "application/pdf")
             },
-            data={
-                "ocr_correction_enabled": "false",
-                "llm_correction_enabled": "false"
-            }
+            data=_UPLOAD_DATA
         )
         
         assert response.status_code == 202
@@ -87,7 +81,7 @@ class TestUploadEndpoint:
         assert "Empty file" in result["error"]
     
     @patch('app.api.routers.upload.FileValidator.validate_uploaded_file')
-    def test_upload_validation_failure(self, mock_validator):
+    def test_upload_validation_failure(self, mock_validator, client):
         """Test upload with validation failure — returns 202 with error in results"""
         # Mock validation failure
         mock_validator.return_value = {
@@ -103,10 +97,7 @@ class TestUploadEndpoint:
             files={
                 "files": ("test.pdf", test_pdf_content, "application/pdf")
             },
-            data={
-                "ocr_correction_enabled": "false",
-                "llm_correction_enabled": "false"
-            }
+            data=_UPLOAD_DATA
         )
         
         assert response.status_code == 202
@@ -117,24 +108,18 @@ class TestUploadEndpoint:
 
 class TestChatEndpoint:
     
-    @patch('app.api.routers.chat.get_embeddings')
-    @patch('app.api.routers.chat.search_multimodal_content')
-    @patch('app.api.routers.chat.process_multimodal_llm_chat_request')
     @patch('app.api.routers.chat.enhance_response_with_media_references')
-    def test_chat_success(self, mock_enhance, mock_llm, mock_search, mock_embeddings):
+    def test_chat_success(self, mock_enhance, client, chat_mocks):
         """Test successful chat request"""
-        # Mock embeddings
-        mock_embeddings.return_value = [[0.1, 0.2, 0.3]]
-        
         # Mock multimodal search results
-        mock_search.return_value = {
+        chat_mocks.search.return_value = {
             'text': [{"text": "Sample document text", "metadata": {"source_document_id": "doc1"}}],
             'images': [],
             'tables': []
         }
         
         # Mock LLM response
-        mock_llm.return_value = "This is the AI response."
+        chat_mocks.llm.return_value = "This is the AI response."
         
         # Mock enhance response
         mock_enhance.return_value = {
@@ -159,7 +144,7 @@ class TestChatEndpoint:
         # FallbackResponseService may enhance short responses with additional info
         assert "This is the AI response." in data["response"]
     
-    def test_chat_empty_query(self):
+    def test_chat_empty_query(self, client):
         """Test chat with empty query"""
         response = client.post(
             "/api/chat/",
@@ -170,7 +155,7 @@ class TestChatEndpoint:
     
     @patch('app.api.routers.chat.sanitize_input')
     @patch('app.api.routers.chat.validate_document_id')
-    def test_chat_invalid_document_id(self, mock_validate_id, mock_sanitize):
+    def test_chat_invalid_document_id(self, mock_validate_id, mock_sanitize, client):
         """Test chat with invalid document ID"""
         mock_sanitize.return_value = "Test query"
         mock_validate_id.return_value = False
@@ -187,28 +172,21 @@ class TestChatEndpoint:
         assert "Invalid document ID" in response.json()["detail"]
     
     @patch('app.api.routers.chat.sanitize_input')
-    def test_chat_input_sanitization(self, mock_sanitize):
+    def test_chat_input_sanitization(self, mock_sanitize, client, chat_mocks):
         """Test that input is properly sanitized"""
         mock_sanitize.return_value = "cleaned query"
         
         # This test ensures sanitize_input is called
-        with patch('app.api.routers.chat.get_embeddings') as mock_embeddings:
-            mock_embeddings.return_value = [[0.1, 0.2, 0.3]]
-            with patch('app.api.routers.chat.search_multimodal_content') as mock_search:
-                mock_search.return_value = {'text': [], 'images': [], 'tables': []}
-                with patch('app.api.routers.chat.process_multimodal_llm_chat_request') as mock_llm:
-                    mock_llm.return_value = "response"
-                    
-                    response = client.post(
-                        "/api/chat/",
-                        json={"query": "  malicious input  "}
-                    )
-                    
-                    mock_sanitize.assert_called_once()
+        response = client.post(
+            "/api/chat/",
+            json={"query": "  malicious input  "}
+        )
+        
+        mock_sanitize.assert_called_once()
 
 class TestStatusEndpoints:
     
-    def test_upload_status_existing(self):
+    def test_upload_status_existing(self, client):
         """Test getting status for existing document"""
         with patch('app.api.routers.upload.pdf_processing_status', {"doc123": {"step": "Done", "message": "Complete"}}):
             response = client.get("/api/upload_status/doc123")
@@ -218,7 +196,7 @@ class TestStatusEndpoints:
             assert data["step"] == "Done"
             assert data["message"] == "Complete"
     
-    def test_upload_status_nonexistent(self):
+    def test_upload_status_nonexistent(self, client):
         """Test getting status for non-existent document"""
         response = client.get("/api/upload_status/nonexistent")
         
@@ -227,7 +205,7 @@ class TestStatusEndpoints:
         assert data["step"] == "Unknown"
     
     @patch('app.api.routers.models.httpx.AsyncClient')
-    def test_ollama_status_running(self, mock_client_class):
+    def test_ollama_status_running(self, mock_client_class, client):
         """Test Ollama status when running"""
         mock_response = Mock()
         mock_response.status_code = 200
@@ -245,7 +223,7 @@ class TestStatusEndpoints:
         assert data["status"] == "running"
     
     @patch('app.api.routers.models.httpx.AsyncClient')
-    def test_ollama_status_not_running(self, mock_client_class):
+    def test_ollama_status_not_running(self, mock_client_class, client):
         """Test Ollama status when not running"""
         mock_client = AsyncMock()
         mock_client.get = AsyncMock(side_effect=Exception("Connection failed"))
@@ -3,19 +3,17 @@
 import pytest
 import tempfile
 import os
+from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
-from fastapi.testclient import TestClient
-from app.main import app
 from app.utils.file_manager import DocumentFileManager
 from app.services.vector_db_service import delete_document, delete_all_documents
 
-client = TestClient(app)
 
 class TestDocumentManagement:
     
     @patch('app.services.vector_db_service.delete_multimodal_document')
     @patch('app.utils.file_manager.DocumentFileManager.delete_file_by_document_id')
-    def test_delete_document_success(self, mock_file_delete, mock_db_delete):
+    def test_delete_document_success(self, mock_file_delete, mock_db_delete, client):
         """Test successful document deletion"""
         # Mock successful deletion from both DB and file system
         mock_db_delete.return_value = True
@@ -32,7 +30,7 @@ class TestDocumentManagement:
     
     @patch('app.services.vector_db_service.delete_multimodal_document')
     @patch('app.utils.file_manager.DocumentFileManager.delete_file_by_document_id')
-    def test_delete_document_not_found(self, mock_file_delete, mock_db_delete):
+    def test_delete_document_not_found(self, mock_file_delete, mock_db_delete, client):
         """Test deletion when document doesn't exist"""
         # Mock no deletion from both DB and file system
         mock_db_delete.return_value = False
@@ -43,7 +41,7 @@ class TestDocumentManagement:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"]
     
-    def test_delete_document_invalid_id(self):
+    def test_delete_document_invalid_id(self, client):
         """Test deletion with invalid document ID"""
         response = client.delete("/api/documents/invalid@id")
         
@@ -53,7 +51,7 @@ class TestDocumentManagement:
     @patch('app.services.vector_db_service.delete_all_multimodal_documents')
     @patch('app.services.vector_db_service.delete_all_documents')
     @patch('app.utils.file_manager.DocumentFileManager.delete_all_files')
-    def test_delete_all_documents_success(self, mock_file_delete_all, mock_db_delete_all, mock_multimodal_db_delete_all):
+    def test_delete_all_documents_success(self, mock_file_delete_all, mock_db_delete_all, mock_multimodal_db_delete_all, client):
         """Test successful deletion of all documents"""
         # Mock successful deletion
         mock_db_delete_all.return_value = 5  # 5 documents deleted
@@ -70,7 +68,7 @@ class TestDocumentManagement:
     
     @patch('app.services.vector_db_service.get_multimodal_document_info')
     @patch('app.utils.file_manager.DocumentFileManager.get_file_info')
-    def test_get_document_details_success(self, mock_file_info, mock_db_info):
+    def test_get_document_details_success(self, mock_file_info, mock_db_info, client):
         """Test getting document details"""
         # Mock document info
         mock_db_info.return_value = {
@@ -93,7 +91,7 @@ class TestDocumentManagement:
         assert data["file_info"]["size_mb"] == 2.5
     
     @patch('app.services.vector_db_service.get_multimodal_document_info')
-    def test_get_document_details_not_found(self, mock_db_info):
+    def test_get_document_details_not_found(self, mock_db_info, client):
         """Test getting details for non-existent document"""
         mock_db_info.return_value = None
         
@@ -104,7 +102,7 @@ class TestDocumentManagement:
     
     @patch('app.services.vector_db_service.get_all_documents')
     @patch('app.utils.file_manager.DocumentFileManager.cleanup_orphaned_files')
-    def test_cleanup_orphaned_files(self, mock_cleanup, mock_get_docs):
+    def test_cleanup_orphaned_files(self, mock_cleanup, mock_get_docs, client):
         """Test cleanup of orphaned files"""
         # Mock existing documents
         mock_get_docs.return_value = [
@@ -122,7 +120,7 @@ class TestDocumentManagement:
     
     @patch('app.utils.file_manager.DocumentFileManager.get_storage_stats')
     @patch('app.services.vector_db_service.get_all_documents')
-    def test_storage_statistics(self, mock_get_docs, mock_file_stats):
+    def test_storage_statistics(self, mock_get_docs, mock_file_stats, client):
         """Test getting storage statistics"""
         # Mock storage stats
         mock_file_stats.return_value = {
@@ -155,7 +153,7 @@ class TestFileManager:
     def test_delete_file_by_document_id(self, temp_dir):
         """Test deleting file by document ID"""
         # Create a test file
-        test_file = os.path.join(tmp_path, "test_doc_123_sample.pdf")
+        test_file = os.path.join(temp_dir, "test_doc_123_sample.pdf")
         with open(test_file, "w") as f:
             f.write("test content")
         
@@ -164,6 +162,18 @@ class TestFileManager:
             assert result == True
             assert not os.path.exists(test_file)
     
+    def test_delete_registered_file(self, tmp_path):
+        """Test deleting a file registered in the document ID index"""
+        test_file = tmp_path / "test_doc_456_sample.pdf"
+        test_file.write_bytes(b"test content")
+        DocumentFileManager.register_file("test_doc_456", test_file)
+        
+        with patch('app.config.settings.UPLOAD_DIR', str(tmp_path)):
+            assert DocumentFileManager.get_file_info("test_doc_456")["filename"] == test_file.name
+            assert DocumentFileManager.delete_file_by_document_id("test_doc_456") == True
+            assert not test_file.exists()
+            assert DocumentFileManager.get_file_info("test_doc_456") is None
+    
     def test_delete_file_nonexistent(self, temp_dir):
         """Test deleting non-existent file"""
         with patch('app.config.settings.UPLOAD_DIR', temp_dir):
@@ -192,9 +202,7 @@ class TestFileManager:
         orphaned_files = ["orphan1_old.pdf", "orphan2_old.pdf"]
         
         for filename in valid_files + orphaned_files:
-            test_file = os.path.join(tmp_path, filename)
-            with open(test_file, "w") as f:
-                f.write("test content")
+            Path(temp_dir, filename).write_bytes(b"test content")
         
         with patch('app.config.settings.UPLOAD_DIR', temp_dir):
             # Only doc1 and doc2 are valid
@@ -202,20 +210,18 @@ class TestFileManager:
             assert count == 2  # 2 orphaned files cleaned
             
             # Check that valid files remain and orphaned files are gone
-            remaining_files = os.listdir(temp_dir)
+            remaining_files = [e.name for e in os.scandir(temp_dir) if e.name.endswith('.pdf')]
             assert "doc1_file.pdf" in remaining_files
             assert "doc2_file.pdf" in remaining_files
             assert "orphan1_old.pdf" not in remaining_files
             assert "orphan2_old.pdf" not in remaining_files
     
-    def test_get_storage_stats(self, tmp_path):
+    def test_get_storage_stats(self, temp_dir):
         """Test getting storage statistics"""
         # Create test files with known sizes
-        test_content = "x" * 1024  # 1KB content
+        test_content = b"x" * 1024  # 1KB content
         for i in range(3):
-            test_file = os.path.join(temp_dir, f"doc_{i}_test.pdf")
-            with open(test_file, "w") as f:
-                f.write(test_content)
+            Path(temp_dir, f"doc_{i}_test.pdf").write_bytes(test_content)
         
         with patch('app.config.settings.UPLOAD_DIR', temp_dir):
             stats = DocumentFileManager.get_storage_stats()
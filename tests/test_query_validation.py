@@ -2,6 +2,7 @@
 Tests for query validation functionality
 """
 import pytest
+from app.utils import query_validator
 from app.utils.query_validator import QueryValidator
 from app.services.fallback_response_service import FallbackResponseService
 
@@ -122,6 +123,18 @@ class TestQueryValidator:
         for query in non_foundry_queries:
             assert QueryValidator.is_foundry_related(query) == False, f"Should not be foundry related: {query}"
     
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    def test_keyword_matcher_backends(self, monkeypatch, use_automaton):
+        """Aho-Corasick 자동자와 정규식 대체 경로가 같은 결과를 내는지 테스트"""
+        if use_automaton and not query_validator.HAS_AHOCORASICK:
+            pytest.skip("pyahocorasick not installed")
+        monkeypatch.setattr(query_validator, "HAS_AHOCORASICK", use_automaton)
+        
+        match = query_validator._build_keyword_matcher(QueryValidator.FOUNDRY_KEYWORDS)
+        assert match("알루미늄 주조 온도는?")
+        assert match("what is a casting defect?")
+        assert not match("오늘 날씨는?")
+    
     def test_query_enhancement(self):
         """질문 향상 테스트"""
         test_cases = [
@@ -153,6 +166,45 @@ class TestQueryValidator:
         suggestions = QueryValidator.get_query_suggestions("ㅇㅇ")
         assert len(suggestions) > 0
         # 기본 제안이 반환되어야 함
+    
+    def test_validation_cache(self):
+        """반복 질문은 캐시된 불변 결과를 그대로 공유"""
+        QueryValidator.cache_clear()
+        first = QueryValidator.validate_query("주조 온도는?")
+        second = QueryValidator.validate_query("주조 온도는?")
+        
+        assert first is second
+        assert second['is_valid'] == True and second.is_valid == True
+        assert QueryValidator._validate_query_cached.cache_info().hits == 1
+        with pytest.raises(TypeError):
+            first['is_valid'] = False  # 호출자가 캐시된 결과를 변경할 수 없음
+    
+    def test_overlong_query_not_cached(self):
+        """길이 제한을 넘는 질문은 캐시에 남기지 않음"""
+        QueryValidator.cache_clear()
+        long_query = "주조" * QueryValidator.MAX_QUERY_LENGTH
+        
+        assert QueryValidator.validate_query(long_query).error_type == 'too_long'
+        assert QueryValidator.is_foundry_related(long_query) == True
+        assert QueryValidator.enhance_query_for_search(long_query).endswith("?")
+        assert QueryValidator._validate_query_cached.cache_info().currsize == 0
+        assert QueryValidator._is_foundry_related_cached.cache_info().currsize == 0
+        assert QueryValidator._enhance_query_cached.cache_info().currsize == 0
+    
+    def test_suggestion_cache(self):
+        """반복 요청된 제안은 캐시를 사용하되 list는 호출마다 새로 생성"""
+        QueryValidator.cache_clear()
+        first = QueryValidator.get_query_suggestions("결함")
+        first.clear()
+        second = QueryValidator.get_query_suggestions("결함")
+        
+        assert "기공 결함을 방지하는 방법은?" in second
+        assert QueryValidator._get_query_suggestions_cached.cache_info().hits == 1
+        
+        long_query = "결함" * QueryValidator.MAX_QUERY_LENGTH
+        assert QueryValidator.get_query_suggestions(long_query) == list(QueryValidator._BASIC_SUGGESTIONS)
+        assert QueryValidator._get_query_suggestions_cached.cache_info().currsize == 1
+        assert QueryValidator._validate_query_cached.cache_info().currsize == 1
 
 class TestFallbackResponseService:
     """FallbackResponseService 테스트"""
@@ -1,10 +1,13 @@
 """Tests for security utilities"""
 
+import hashlib
+import unicodedata
 import pytest
 import tempfile
 import os
 from pathlib import Path
 from app.utils.security import FileValidator, sanitize_input, validate_document_id
+from app.utils.sanitizer import ContentSanitizer, sanitize_llm_response, _sanitize_llm_response_cached
 
 class TestFileValidator:
     
@@ -51,6 +54,13 @@ class TestFileValidator:
         assert safe.startswith(doc_id)
         assert "주물기술총서" in safe
         assert ".pdf" in safe
+    
+    def test_generate_safe_filename_nfd_korean(self):
+        """Test decomposed (NFD) Korean filenames are composed to NFC"""
+        original = unicodedata.normalize("NFD", "주조방안.pdf")
+        safe = FileValidator.generate_safe_filename(original, "doc123")
+        
+        assert safe == "doc123_주조방안.pdf"
         
     def test_generate_safe_filename_forbidden_chars(self):
         """Test safe filename generation removes forbidden characters"""
@@ -64,7 +74,7 @@ class TestFileValidator:
         for char in forbidden_chars:
             assert char not in safe
     
-    def test_calculate_file_hash(self, tmp_path):
+    def test_calculate_file_hash(self, temp_dir):
         """Test file hash calculation"""
         test_file = Path(temp_dir) / "test.txt"
         test_file.write_text("test content")
@@ -73,7 +83,11 @@ class TestFileValidator:
         hash2 = FileValidator.calculate_file_hash(str(test_file))
         
         assert hash1 == hash2  # Same file should produce same hash
-        assert len(hash1) == 64  # SHA256 produces 64 character hex string
+        assert len(hash1) == 64  # BLAKE3 and SHA256 both produce 64 character hex strings
+        
+        # SHA256 remains available as an explicit opt-in
+        sha256 = FileValidator.calculate_file_hash(str(test_file), algorithm="sha256")
+        assert sha256 == hashlib.sha256(b"test content").hexdigest()
     
     def test_calculate_file_hash_nonexistent(self):
         """Test hash calculation for non-existent file"""
@@ -105,6 +119,11 @@ class TestInputSanitization:
         input_text = "  test query  "
         result = sanitize_input(input_text)
         assert result == "test query"
+    
+    def test_sanitize_input_control_characters(self):
+        """Test control characters are removed but line breaks are kept"""
+        assert sanitize_input("test\x00 que\x1bry\x7f") == "test query"
+        assert sanitize_input("line1\nline2\tend") == "line1\nline2\tend"
 
 class TestDocumentIdValidation:
     
@@ -134,4 +153,34 @@ class TestDocumentIdValidation:
         assert validate_document_id("doc<123") == False
         assert validate_document_id("doc>123") == False
         assert validate_document_id("doc|123") == False
-        assert validate_document_id("a" * 201) == False  # Too long (increased limit)
\ No newline at end of file
+        assert validate_document_id("a" * 201) == False  # Too long (increased limit)
+    
+    def test_validate_document_id_cached(self):
+        """Test repeated IDs are served from the validation cache"""
+        validate_document_id.cache_clear()
+        assert validate_document_id("doc123") == True
+        assert validate_document_id("doc123") == True
+        assert validate_document_id.cache_info().hits == 1
+
+class TestContentSanitizer:
+    
+    def test_removed_token_does_not_splice_event_handler(self):
+        """Test removing a dangerous tag cannot join an event handler together"""
+        payload = "<p onc<input>lick=alert(1)>hi</p>"
+        assert ContentSanitizer.sanitize_html_content(payload) == "<p alert(1)>hi</p>"
+        assert "onclick" not in ContentSanitizer.sanitize_markdown_content(payload)
+    
+    def test_removed_token_does_not_splice_protocol(self):
+        """Test removing a dangerous tag cannot join a javascript: protocol together"""
+        payload = "java<input>script:alert(1)"
+        assert ContentSanitizer.sanitize_html_content(payload) == "alert(1)"
+        assert ContentSanitizer.sanitize_markdown_content(payload) == "alert(1)"
+    
+    def test_cached_llm_response_stays_sanitized(self):
+        """Test the cached sanitize path returns (and re-serves) the safe output"""
+        _sanitize_llm_response_cached.cache_clear()
+        for content_type in ("markdown", "html"):
+            for _ in range(2):
+                assert "onclick" not in sanitize_llm_response("<p onc<input>lick=alert(1)>hi</p>", content_type)
+                assert sanitize_llm_response("java<input>script:alert(1)", content_type) == "alert(1)"
+        assert _sanitize_llm_response_cached.cache_info().hits == 4
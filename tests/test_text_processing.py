@@ -50,6 +50,24 @@ class TestFoundryTermCorrection:
         corrected = correct_foundry_terms(text)
         
         assert corrected == text
+    
+    def test_correct_foundry_terms_longest_match(self):
+        """Test multi-word variations win over their single-word prefixes"""
+        corrected = correct_foundry_terms("Sand Mold 와 core box, 주헝")
+        
+        assert corrected == "사형 와 코어박스, 주형"
+    
+    def test_correct_foundry_terms_casefold_only_match(self):
+        """Test case-insensitive matches that lower() cannot key (U+017F) still map"""
+        corrected = correct_foundry_terms("\u017fand mold")
+        
+        assert corrected == "사형"
+    
+    def test_correct_foundry_terms_chained(self):
+        """Test a correction that produces another known error is corrected again"""
+        corrected = correct_foundry_terms("주혈사 제작")
+        
+        assert corrected == "주형 제작"
 
 class TestEmbeddingGeneration:
     
@@ -79,17 +97,32 @@ class TestEmbeddingGeneration:
         """Test batch processing of embeddings"""
         # Mock the model
         mock_model = Mock()
-        mock_model.encode.return_value = np.array([[0.1, 0.2], [0.3, 0.4]])
+        mock_model.encode.return_value = np.array([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6], [0.7, 0.8]])
         mock_manager.get_model.return_value = mock_model
         
         # Test with batch_size smaller than input
         text_chunks = ["chunk1", "chunk2", "chunk3", "chunk4"]
         embeddings = get_embeddings(text_chunks, batch_size=2)
         
-        # Should call encode twice (2 batches of 2 items each)
-        assert mock_model.encode.call_count == 2
+        # Should call encode once and let the model batch internally
+        assert mock_model.encode.call_count == 1
+        assert mock_model.encode.call_args.kwargs["batch_size"] == 2
         assert len(embeddings) == 4
 
+    @patch('app.services.text_processing_service.model_manager')
+    def test_get_embeddings_as_numpy(self, mock_manager):
+        """Test ndarray output keeps order and zero-fills short chunks"""
+        mock_model = Mock()
+        mock_model.encode.return_value = np.array([[0.1, 0.2], [0.3, 0.4]])
+        mock_manager.get_model.return_value = mock_model
+        
+        embeddings = get_embeddings(["chunk1", "x", "chunk3"], as_numpy=True)
+        
+        assert isinstance(embeddings, np.ndarray)
+        assert embeddings.dtype == np.float32
+        assert embeddings.flags["C_CONTIGUOUS"]
+        assert np.allclose(embeddings, [[0.1, 0.2], [0.0, 0.0], [0.3, 0.4]])
+
 class TestEmbeddingModelManager:
     
     def test_singleton_pattern(self):